@@ -0,0 +1,97 @@
+"""分页游标编解码
+
+游标是经过 HMAC-SHA256 签名的不透明字符串，记录上一页最后一条资讯的排序键
+(collected_at, post_id)。服务端不保存任何游标状态，签名保证客户端无法伪造
+游标去扫描任意区间。排序键结构变化时递增 CURSOR_VERSION，旧游标会被拒绝。
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import hmac
+import logging
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger("rayinfo.api.cursor")
+
+# 游标格式版本，排序键或编码方式变化时递增
+CURSOR_VERSION = 1
+
+# collected_at 以 naive UTC 存储，游标中的时间戳以此为基准换算
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+_secret: Optional[bytes] = None
+
+
+def _default_secret() -> bytes:
+    """获取配置的签名密钥，未配置时生成进程内随机密钥"""
+    global _secret
+    if _secret is None:
+        configured = get_settings().cursor_secret
+        if configured:
+            _secret = configured.encode("utf-8")
+        else:
+            logger.warning("未配置 cursor_secret，使用随机密钥，重启后分页游标将失效")
+            _secret = secrets.token_bytes(32)
+    return _secret
+
+
+def encode_cursor(
+    collected_at: datetime, post_id: str, secret: Optional[bytes] = None
+) -> str:
+    """将排序键编码为签名游标
+
+    Args:
+        collected_at: 当前页最后一条资讯的采集时间
+        post_id: 当前页最后一条资讯的ID
+        secret: 签名密钥，默认使用配置中的 cursor_secret
+
+    Returns:
+        str: base64 编码的 "签名 + 版本 + {collected_at 微秒时间戳}:{post_id}"
+    """
+    if collected_at.tzinfo is not None:
+        collected_at = collected_at.astimezone(timezone.utc).replace(tzinfo=None)
+    micros = (collected_at - _EPOCH) // _MICROSECOND
+    payload = bytes([CURSOR_VERSION]) + f"{micros}:{post_id}".encode("utf-8")
+    signature = hmac.new(secret or _default_secret(), payload, hashlib.sha256)
+    return base64.urlsafe_b64encode(signature.digest() + payload).decode("ascii")
+
+
+def decode_cursor(cursor: str, secret: Optional[bytes] = None) -> Tuple[datetime, str]:
+    """校验签名并解析游标为 (collected_at, post_id)
+
+    Args:
+        cursor: encode_cursor 生成的游标
+        secret: 签名密钥，默认使用配置中的 cursor_secret
+
+    Returns:
+        Tuple[datetime, str]: (采集时间, 资讯ID)
+
+    Raises:
+        ValueError: 游标格式不合法、签名不匹配或版本已过期
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii"))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError(f"无效的分页游标: {cursor}") from exc
+
+    signature, payload = raw[:_DIGEST_SIZE], raw[_DIGEST_SIZE:]
+    expected = hmac.new(secret or _default_secret(), payload, hashlib.sha256)
+    if not payload or not hmac.compare_digest(signature, expected.digest()):
+        raise ValueError(f"无效的分页游标: {cursor}")
+    if payload[0] != CURSOR_VERSION:
+        raise ValueError("分页游标已过期，请从第一页重新加载")
+
+    try:
+        micros, post_id = payload[1:].decode("utf-8").split(":", 1)
+        return _EPOCH + int(micros) * _MICROSECOND, post_id
+    except (UnicodeError, ValueError) as exc:
+        raise ValueError(f"无效的分页游标: {cursor}") from exc
@@ -5,12 +5,94 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import List, Optional, Tuple, Dict, Any, Sequence
-from sqlalchemy import func, desc, or_
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    String,
+    any_,
+    bindparam,
+    column,
+    desc,
+    exists,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased, defer
+
+from ..api.schemas import ArticleFilters, SourceStats
+from ..models.info_item import (
+    SEARCH_FTS_TABLE,
+    ArticleReadStatus,
+    DatabaseManager,
+    RawInfoItem,
+    SourceStat,
+    utcnow,
+)
+from ..utils.display_names import collector_display_name
+from .cursor_utils import decode_cursor, encode_cursor
+
+# upsert 语句 RETURNING 的已读状态列，与 ReadStatusResponse 的字段对应
+_READ_STATUS_COLUMNS = (
+    ArticleReadStatus.post_id,
+    ArticleReadStatus.is_read,
+    ArticleReadStatus.read_at,
+    ArticleReadStatus.updated_at,
+)
+
+# 列表接口不返回 raw_data，延迟加载以避免读取和反序列化大体积 JSON
+_LIST_LOAD_OPTIONS = (defer(RawInfoItem.raw_data),)
+
+# SQLite 的 FTS5 搜索索引表，rowid 与资讯表的 rowid 一一对应
+_SEARCH_FTS = table(SEARCH_FTS_TABLE, column("rowid"))
+# trigram 分词按 3 个字符切分，更短的关键词无法走 FTS 索引
+_FTS_MIN_QUERY_LENGTH = 3
+
+# 流式响应每批从数据库读取的行数，内存中最多同时持有一批资讯
+STREAM_BATCH_SIZE = 50
+
+
+def _upsert_insert(session: Session):
+    """返回当前数据库方言支持 ON CONFLICT 的 insert 构造函数
+
+    Args:
+        session: 数据库会话
+
+    Returns:
+        PostgreSQL 或 SQLite 方言的 insert 函数
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
 
-from ..models.info_item import RawInfoItem, ArticleReadStatus, DatabaseManager
-from ..api.schemas import ArticleFilters
+def _post_id_in(session: Session, column, post_ids: Sequence[str]):
+    """构建按一组资讯ID筛选的条件
+
+    PostgreSQL 上使用 ``= ANY(:ids)`` 把整个ID列表作为一个数组参数传入，
+    不同长度的列表共享同一条语句文本和执行计划；其他数据库使用 IN 列表。
+
+    Args:
+        session: 数据库会话
+        column: 资讯ID列
+        post_ids: 资讯ID列表
+
+    Returns:
+        可用于 where 的布尔表达式
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        return column == any_(
+            bindparam("post_ids", list(post_ids), type_=postgresql.ARRAY(String))
+        )
+    return column.in_(list(post_ids))
 
 
 class ArticleRepository:
@@ -18,6 +100,8 @@ class ArticleRepository:
 
     使用 Repository 模式封装所有与资讯数据相关的数据库操作，
     提供统一的数据访问接口，便于单元测试和业务逻辑分离。
+
+    实例是线程安全的：每个方法都创建并关闭自己的会话，不在实例上保存状态。
     """
 
     def __init__(self, db_manager: Optional[DatabaseManager] = None):
@@ -30,35 +114,29 @@ class ArticleRepository:
 
     def get_articles_paginated(
         self, filters: ArticleFilters
-    ) -> Tuple[List[RawInfoItem], int]:
+    ) -> Tuple[List[RawInfoItem], Optional[int], Optional[str]]:
         """获取分页资讯列表
 
         Args:
             filters: 筛选和分页参数
 
         Returns:
-            Tuple[List[RawInfoItem], int]: (资讯列表, 总数量)
+            Tuple[List[RawInfoItem], Optional[int], Optional[str]]: (资讯列表, 总数量（未请求时为None）, 下一页游标)
         """
         with self.db_manager.get_session() as session:
             # 构建基础查询
-            query = session.query(RawInfoItem)
+            query = select(RawInfoItem).options(*_LIST_LOAD_OPTIONS)
 
             # 应用筛选条件
             query = self._apply_filters(query, filters)
 
-            # 获取总数量
-            total_count = query.count()
+            # 仅在调用方需要时统计总数量
+            total_count = self._count_total(session, query, filters)
 
             # 应用分页和排序
-            offset = (filters.page - 1) * filters.limit
-            articles = (
-                query.order_by(desc(RawInfoItem.collected_at))  # 按采集时间倒序
-                .offset(offset)
-                .limit(filters.limit)
-                .all()
-            )
+            articles, next_cursor = self._paginate(session, query, filters)
 
-            return articles, total_count
+            return articles, total_count, next_cursor
 
     def get_article_by_id(self, post_id: str) -> Optional[RawInfoItem]:
         """根据ID获取资讯详情
@@ -70,99 +148,288 @@ class ArticleRepository:
             RawInfoItem: 资讯对象，如果不存在则返回None
         """
         with self.db_manager.get_session() as session:
-            return (
-                session.query(RawInfoItem)
-                .filter(RawInfoItem.post_id == post_id)
-                .first()
-            )
+            return session.get(RawInfoItem, post_id)
 
     def search_articles(
         self, search_query: str, filters: ArticleFilters
-    ) -> Tuple[List[RawInfoItem], int]:
+    ) -> Tuple[
+        List[Tuple[RawInfoItem, Optional[ArticleReadStatus]]],
+        Optional[int],
+        Optional[str],
+    ]:
         """搜索资讯
 
+        与列表查询一样左连接已读状态表，一次查询同时取回资讯和已读状态。
+
         Args:
             search_query: 搜索关键词
             filters: 筛选和分页参数
 
         Returns:
-            Tuple[List[RawInfoItem], int]: (资讯列表, 总数量)
+            Tuple[List[Tuple[RawInfoItem, Optional[ArticleReadStatus]]], Optional[int], Optional[str]]:
+                (资讯和已读状态列表, 总数量（未请求时为None）, 下一页游标)
         """
         with self.db_manager.get_session() as session:
             # 构建搜索查询
-            search_pattern = f"%{search_query}%"
-            query = session.query(RawInfoItem).filter(
-                or_(
-                    RawInfoItem.title.ilike(search_pattern),
-                    RawInfoItem.description.ilike(search_pattern),
-                    RawInfoItem.query.ilike(search_pattern),
+            query = (
+                select(RawInfoItem, ArticleReadStatus)
+                .options(*_LIST_LOAD_OPTIONS)
+                .outerjoin(
+                    ArticleReadStatus,
+                    RawInfoItem.post_id == ArticleReadStatus.post_id,
                 )
+                .where(self._search_condition(session, search_query))
             )
 
             # 应用其他筛选条件（除了query字段）
             query = self._apply_filters(query, filters, exclude_query=True)
 
-            # 获取总数量
-            total_count = query.count()
+            # 应用分页和排序，需要总数量时随页数据一并取回
+            return self._paginate_with_total(session, query, filters)
 
-            # 应用分页和排序
-            offset = (filters.page - 1) * filters.limit
-            articles = (
-                query.order_by(desc(RawInfoItem.collected_at))
-                .offset(offset)
-                .limit(filters.limit)
-                .all()
-            )
+    def _search_condition(self, session: Session, search_query: str):
+        """构建关键词匹配条件
 
-            return articles, total_count
+        所有数据库都对标题、描述、查询词做 ILIKE 子串匹配。PostgreSQL 上额外
+        匹配 search_tsv 全文检索列，支持多个词不分先后的查询；ILIKE 由 pg_trgm
+        索引加速，保证 simple 分词配置下中文子串仍能命中。SQLite 上关键词不少于
+        3 个字符时改为查询 trigram FTS5 索引，短语匹配即三列的子串匹配。
+
+        Args:
+            session: 数据库会话
+            search_query: 搜索关键词
+
+        Returns:
+            可用于 where 的布尔表达式
+        """
+        dialect = session.get_bind().dialect.name
+        if (
+            dialect == "sqlite"
+            and self.db_manager.search_fts_enabled
+            and len(search_query) >= _FTS_MIN_QUERY_LENGTH
+        ):
+            # 整个关键词作为一个短语，双引号按 FTS5 语法转义
+            phrase = '"' + search_query.replace('"', '""') + '"'
+            matched = select(_SEARCH_FTS.c.rowid).where(
+                literal_column(SEARCH_FTS_TABLE).match(phrase)
+            )
+            return literal_column(f"{RawInfoItem.__tablename__}.rowid").in_(matched)
+
+        search_pattern = f"%{search_query}%"
+        conditions = [
+            RawInfoItem.title.ilike(search_pattern),
+            RawInfoItem.description.ilike(search_pattern),
+            RawInfoItem.query.ilike(search_pattern),
+        ]
+        if dialect == "postgresql":
+            # search_tsv 是仅存在于 PostgreSQL 的生成列，未映射到 ORM 模型
+            search_tsv = literal_column(f"{RawInfoItem.__tablename__}.search_tsv")
+            conditions.append(
+                search_tsv.op("@@", is_comparison=True)(
+                    func.plainto_tsquery("simple", search_query)
+                )
+            )
+        return or_(*conditions)
 
-    def get_sources_stats(self) -> List[Dict[str, Any]]:
+    def get_sources_stats(self) -> List[SourceStats]:
         """获取来源统计信息
 
         Returns:
-            List[Dict[str, Any]]: 来源统计列表
+            List[SourceStats]: 来源统计列表
         """
         with self.db_manager.get_session() as session:
-            # 按来源分组统计
-            stats = (
-                session.query(
-                    RawInfoItem.source,
-                    func.count(RawInfoItem.post_id).label("count"),
-                    func.max(RawInfoItem.collected_at).label("latest_update"),
+            # 读取触发器维护的汇总表，每个来源一行，不扫描资讯表
+            stats = session.scalars(select(SourceStat).order_by(SourceStat.name))
+
+            return [
+                SourceStats(
+                    name=stat.name,
+                    display_name=collector_display_name(stat.name),
+                    count=stat.count,
+                    latest_update=stat.latest_update,
                 )
-                .group_by(RawInfoItem.source)
-                .all()
+                for stat in stats
+            ]
+
+    def _count_total(
+        self, session, query, filters: ArticleFilters
+    ) -> Optional[int]:
+        """统计筛选后的总数量
+
+        COUNT(*) 需要完整扫描筛选结果，因此只在 include_total 时执行。
+
+        Returns:
+            Optional[int]: 总数量，未请求时返回None
+        """
+        if not filters.include_total:
+            return None
+
+        return self._exact_total(session, query)
+
+    def _exact_total(self, session: Session, query) -> int:
+        """精确统计查询结果的行数
+
+        Args:
+            session: 数据库会话
+            query: 已应用全部筛选条件的 select 语句
+
+        Returns:
+            int: 结果行数
+        """
+        return session.scalar(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+
+    def _paginate_with_total(
+        self, session: Session, query, filters: ArticleFilters
+    ) -> Tuple[
+        List[Tuple[RawInfoItem, Optional[ArticleReadStatus]]],
+        Optional[int],
+        Optional[str],
+    ]:
+        """分页读取 (资讯, 已读状态) 行，按需统计总数量
+
+        OFFSET 分页时在页查询上附加 COUNT(*) OVER ()，总数随当前页一次取回，
+        不再单独执行 COUNT 查询。游标分页的 WHERE 条件会截掉前面的行，
+        页码超出范围时结果为空、窗口函数没有行可携带总数，这两种情况仍单独统计。
+
+        Args:
+            session: 数据库会话
+            query: 已应用筛选条件的 (资讯, 已读状态) select 语句
+            filters: 筛选和分页参数
+
+        Returns:
+            Tuple[List[Tuple[RawInfoItem, Optional[ArticleReadStatus]]], Optional[int], Optional[str]]:
+                (资讯和已读状态列表, 总数量（未请求时为None）, 下一页游标)
+        """
+        total_count = None
+        windowed = filters.include_total and not filters.cursor
+
+        page_query = query
+        if windowed:
+            page_query = query.add_columns(func.count().over().label("total_count"))
+        elif filters.include_total:
+            total_count = self._exact_total(session, query)
+
+        rows, next_cursor = self._paginate(
+            session,
+            page_query,
+            filters,
+            article_of=lambda row: row[0],
+            deferred_join=not windowed,
+        )
+
+        if windowed:
+            if rows:
+                total_count = rows[0].total_count
+                rows = [(row[0], row[1]) for row in rows]
+            else:
+                total_count = self._exact_total(session, query)
+
+        return rows, total_count, next_cursor
+
+    def _paginate(
+        self,
+        session: Session,
+        query,
+        filters: ArticleFilters,
+        article_of: Optional[Callable[[Any], RawInfoItem]] = None,
+        deferred_join: bool = True,
+    ) -> Tuple[List[Any], Optional[str]]:
+        """按 (collected_at, post_id) 倒序分页
+
+        提供游标时使用 keyset 分页，直接从上一页末尾继续扫描；
+        否则退回到兼容旧客户端的 OFFSET 分页。多取一条用于判断是否还有下一页。
+        结果按页大小分批从游标读取，不经过 Query.all() 的整体物化。
+
+        Args:
+            session: 数据库会话
+            query: 已应用筛选条件的 select 语句
+            filters: 筛选和分页参数
+            article_of: 结果行为多实体时从中取出资讯对象的函数；
+                为 None 时按单实体查询返回资讯对象本身
+            deferred_join: OFFSET 分页时是否先只翻页主键再回表，见 _page_statement
+
+        Returns:
+            Tuple[List[Any], Optional[str]]: (当前页结果, 下一页游标)
+        """
+        result = session.execute(
+            self._page_statement(query, filters, deferred_join=deferred_join)
+        )
+        rows = result.scalars().all() if article_of is None else result.all()
+        if len(rows) <= filters.limit:
+            return rows, None
+
+        rows = rows[: filters.limit]
+        last = rows[-1] if article_of is None else article_of(rows[-1])
+        return rows, encode_cursor(last.collected_at, last.post_id)
+
+    def _page_statement(
+        self, query, filters: ArticleFilters, *, deferred_join: bool = True
+    ):
+        """为查询加上分页条件、排序和 limit+1 的探测行
+
+        OFFSET 分页（page > 1）时使用 deferred join：内层查询只取 post_id，
+        沿 (collected_at, post_id) 覆盖索引跳过前面的行，外层再按主键读取当前页
+        的完整行和已读状态，被丢弃的行不再回表。查询带有 COUNT(*) OVER () 等
+        需要完整结果集的列时，调用方应关闭 deferred_join。
+
+        Args:
+            query: 已应用筛选条件的 select 语句
+            filters: 筛选和分页参数
+            deferred_join: OFFSET 分页时是否先只翻页主键再回表
+
+        Returns:
+            可直接执行的 select 语句
+
+        Raises:
+            ValueError: 游标不合法
+        """
+        order_by = (desc(RawInfoItem.collected_at), desc(RawInfoItem.post_id))
+        page_size = filters.limit + 1
+
+        if filters.cursor:
+            cursor_at, cursor_id = decode_cursor(filters.cursor)
+            query = query.where(
+                tuple_(RawInfoItem.collected_at, RawInfoItem.post_id)
+                < tuple_(cursor_at, cursor_id)
             )
+            offset = 0
+        else:
+            # 已弃用：深分页时 OFFSET 需要扫描并丢弃前面所有行
+            offset = (filters.page - 1) * filters.limit
 
-            # 转换为字典格式
-            result = []
-            for stat in stats:
-                result.append(
-                    {
-                        "name": stat.source,
-                        "display_name": self._get_display_name(stat.source),
-                        "count": stat.count,
-                        "latest_update": stat.latest_update,
-                    }
-                )
+        if offset and deferred_join:
+            page_ids = (
+                query.with_only_columns(RawInfoItem.post_id)
+                .order_by(*order_by)
+                .offset(offset)
+                .limit(page_size)
+                .subquery("page_ids")
+            )
+            query = query.join(page_ids, RawInfoItem.post_id == page_ids.c.post_id)
+            return query.order_by(*order_by).execution_options(yield_per=page_size)
 
-            return result
+        query = query.order_by(*order_by)
+        if offset:
+            query = query.offset(offset)
+        return query.limit(page_size).execution_options(yield_per=page_size)
 
     def _apply_common_filters(
         self, query, filters: ArticleFilters, *, exclude_query: bool = False
     ):
         """应用通用筛选条件"""
         if filters.source:
-            query = query.filter(RawInfoItem.source == filters.source)
+            query = query.where(RawInfoItem.source == filters.source)
 
         if filters.query and not exclude_query:
-            query = query.filter(RawInfoItem.query == filters.query)
+            query = query.where(RawInfoItem.query == filters.query)
 
         if filters.start_date:
-            query = query.filter(RawInfoItem.collected_at >= filters.start_date)
+            query = query.where(RawInfoItem.collected_at >= filters.start_date)
 
         if filters.end_date:
-            query = query.filter(RawInfoItem.collected_at <= filters.end_date)
+            query = query.where(RawInfoItem.collected_at <= filters.end_date)
 
         return query
 
@@ -178,62 +445,76 @@ class ArticleRepository:
 
         return query
 
-    def _get_display_name(self, source: str) -> str:
-        """获取来源的显示名称
+    # 已读状态相关方法
+
+    def update_read_status(self, post_id: str, is_read: bool) -> Optional[Row]:
+        """更新资讯的已读状态
+
+        存在性检查和写入合并为一条语句，见 ``update_read_statuses``。
 
         Args:
-            source: 来源标识
+            post_id: 资讯ID
+            is_read: 是否已读
 
         Returns:
-            str: 显示名称
+            Optional[Row]: 更新后的状态行（post_id、is_read、read_at、updated_at），
+                资讯不存在时返回None
         """
-        display_names = {
-            "mes.search": "搜索引擎",
-            "weibo.home": "微博首页",
-            "rss.feed": "RSS订阅",
-        }
-        return display_names.get(source, source)
+        rows = self.update_read_statuses([post_id], is_read)
+        return rows[0] if rows else None
 
-    # 已读状态相关方法
+    def update_read_statuses(
+        self, post_ids: Sequence[str], is_read: bool
+    ) -> List[Row]:
+        """将一批资讯设置为同一已读状态
 
-    def update_read_status(self, post_id: str, is_read: bool) -> ArticleReadStatus:
-        """更新资讯的已读状态
+        存在性检查和写入合并为一条语句：INSERT ... SELECT 从资讯表按主键取出
+        post_id，不存在的资讯不会插入任何行；已有状态记录时走 ON CONFLICT 更新。
+        SELECT 按 post_id 排序，并发批次以一致的顺序加行锁。
 
         Args:
-            post_id: 资讯ID
+            post_ids: 资讯ID列表
             is_read: 是否已读
 
         Returns:
-            ArticleReadStatus: 更新后的已读状态对象
+            List[Row]: 已写入的状态行（post_id、is_read、read_at、updated_at），
+                按 post_ids 中的顺序排列，不存在的资讯不出现在结果中
         """
-        with self.db_manager.get_session() as session:
-            # 查找现有的已读状态记录
-            read_status = (
-                session.query(ArticleReadStatus)
-                .filter(ArticleReadStatus.post_id == post_id)
-                .first()
-            )
-
-            current_time = datetime.utcnow()
+        if not post_ids:
+            return []
 
-            if read_status:
-                # 更新现有记录
-                read_status.is_read = is_read
-                read_status.read_at = current_time if is_read else None
-                read_status.updated_at = current_time
-            else:
-                # 创建新记录
-                read_status = ArticleReadStatus(
-                    post_id=post_id,
-                    is_read=is_read,
-                    read_at=current_time if is_read else None,
-                    updated_at=current_time,
+        with self.db_manager.get_session() as session:
+            current_time = utcnow()
+
+            insert = _upsert_insert(session)
+            source = (
+                select(
+                    RawInfoItem.post_id,
+                    literal(is_read, Boolean),
+                    literal(current_time if is_read else None, DateTime),
+                    literal(current_time, DateTime),
                 )
-                session.add(read_status)
-
+                .where(_post_id_in(session, RawInfoItem.post_id, post_ids))
+                .order_by(RawInfoItem.post_id)
+            )
+            stmt = insert(ArticleReadStatus).from_select(
+                ["post_id", "is_read", "read_at", "updated_at"], source
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ArticleReadStatus.post_id],
+                set_={
+                    "is_read": stmt.excluded.is_read,
+                    "read_at": stmt.excluded.read_at,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            ).returning(*_READ_STATUS_COLUMNS)
+
+            rows = {row.post_id: row for row in session.execute(stmt)}
             session.commit()
-            session.refresh(read_status)
-            return read_status
+
+            return [
+                rows[post_id] for post_id in dict.fromkeys(post_ids) if post_id in rows
+            ]
 
     def get_read_status(self, post_id: str) -> Optional[ArticleReadStatus]:
         """获取资讯的已读状态
@@ -245,68 +526,76 @@ class ArticleRepository:
             ArticleReadStatus: 已读状态对象，如果不存在则返回None
         """
         with self.db_manager.get_session() as session:
-            return (
-                session.query(ArticleReadStatus)
-                .filter(ArticleReadStatus.post_id == post_id)
-                .first()
-            )
+            return session.get(ArticleReadStatus, post_id)
 
-    def get_read_status_map(
-        self, post_ids: Sequence[str]
-    ) -> Dict[str, ArticleReadStatus]:
-        """批量获取资讯的已读状态映射
+    def get_articles_with_read_status(
+        self, filters: ArticleFilters
+    ) -> Tuple[
+        List[Tuple[RawInfoItem, Optional[ArticleReadStatus]]],
+        Optional[int],
+        Optional[str],
+    ]:
+        """获取带已读状态的分页资讯列表
 
         Args:
-            post_ids: 资讯ID序列
+            filters: 筛选和分页参数
 
         Returns:
-            Dict[str, ArticleReadStatus]: 以资讯ID为键的已读状态映射
+            Tuple[List[Tuple[RawInfoItem, Optional[ArticleReadStatus]]], Optional[int], Optional[str]]:
+                (资讯和已读状态列表, 总数量（未请求时为None）, 下一页游标)
         """
-        if not post_ids:
-            return {}
-
         with self.db_manager.get_session() as session:
-            statuses = (
-                session.query(ArticleReadStatus)
-                .filter(ArticleReadStatus.post_id.in_(list(post_ids)))
-                .all()
-            )
+            query = self._articles_with_read_status_query(filters)
 
-            return {status.post_id: status for status in statuses}
+            # 应用分页和排序，需要总数量时随页数据一并取回
+            return self._paginate_with_total(session, query, filters)
 
-    def get_articles_with_read_status(
+    def iter_articles_with_read_status(
         self, filters: ArticleFilters
-    ) -> Tuple[List[Tuple[RawInfoItem, Optional[ArticleReadStatus]]], int]:
-        """获取带已读状态的分页资讯列表
+    ) -> Iterator[Row]:
+        """逐行读取带已读状态的资讯，供流式响应使用
+
+        语句在调用时立即构建（游标错误会在此处抛出），结果在迭代时才从数据库
+        按 STREAM_BATCH_SIZE 分批读取；会话在迭代结束或生成器关闭时释放。最多产出 limit+1 行，
+        第 limit+1 行仅用于判断是否还有下一页。
 
         Args:
             filters: 筛选和分页参数
 
         Returns:
-            Tuple[List[Tuple[RawInfoItem, Optional[ArticleReadStatus]]], int]: (资讯和已读状态列表, 总数量)
+            Iterator[Row]: (资讯, 已读状态) 行迭代器
+
+        Raises:
+            ValueError: 游标不合法
         """
+        stmt = self._page_statement(
+            self._articles_with_read_status_query(filters), filters
+        ).execution_options(yield_per=STREAM_BATCH_SIZE)
+        return self._iter_rows(stmt)
+
+    def _iter_rows(self, stmt) -> Iterator[Row]:
+        """在独立会话中执行语句并逐行产出结果"""
         with self.db_manager.get_session() as session:
-            # 构建基础查询，左连接已读状态表
-            query = session.query(RawInfoItem, ArticleReadStatus).outerjoin(
-                ArticleReadStatus, RawInfoItem.post_id == ArticleReadStatus.post_id
-            )
+            yield from session.execute(stmt)
 
-            # 应用筛选条件
-            query = self._apply_filters_with_read_status(query, filters)
+    def _articles_with_read_status_query(self, filters: ArticleFilters):
+        """构建左连接已读状态表并应用筛选条件的列表查询
 
-            # 获取总数量
-            total_count = query.count()
+        Args:
+            filters: 筛选参数
 
-            # 应用分页和排序
-            offset = (filters.page - 1) * filters.limit
-            results = (
-                query.order_by(desc(RawInfoItem.collected_at))
-                .offset(offset)
-                .limit(filters.limit)
-                .all()
+        Returns:
+            未分页的 select 语句
+        """
+        query = (
+            select(RawInfoItem, ArticleReadStatus)
+            .options(*_LIST_LOAD_OPTIONS)
+            .outerjoin(
+                ArticleReadStatus,
+                RawInfoItem.post_id == ArticleReadStatus.post_id,
             )
-
-            return results, total_count
+        )
+        return self._apply_filters_with_read_status(query, filters)
 
     def _apply_filters_with_read_status(
         self, query, filters: ArticleFilters, exclude_query: bool = False
@@ -314,7 +603,7 @@ class ArticleRepository:
         """应用筛选条件到带已读状态的查询
 
         Args:
-            query: SQLAlchemy查询对象
+            query: SQLAlchemy select 语句
             filters: 筛选参数
             exclude_query: 是否排除query字段筛选
 
@@ -324,16 +613,18 @@ class ArticleRepository:
         query = self._apply_common_filters(query, filters, exclude_query=exclude_query)
 
         # 已读状态筛选
+        # 没有状态记录的资讯视为未读，因此两种筛选都基于“是否存在已读记录”判断
         if filters.read_status:
+            # 外层查询已 outer join 状态表，子查询使用别名避免被自动关联
+            status = aliased(ArticleReadStatus)
+            is_read = exists().where(
+                status.post_id == RawInfoItem.post_id,
+                status.is_read == True,
+            )
             if filters.read_status == "read":
-                query = query.filter(ArticleReadStatus.is_read == True)
+                query = query.where(is_read)
             elif filters.read_status == "unread":
-                query = query.filter(
-                    or_(
-                        ArticleReadStatus.is_read == False,
-                        ArticleReadStatus.is_read.is_(None),
-                    )
-                )
+                query = query.where(~is_read)
             # 'all' 或其他值不做筛选
 
         return query
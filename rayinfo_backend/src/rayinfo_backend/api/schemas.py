@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ArticleBase(BaseModel):
@@ -27,8 +27,7 @@ class ArticleBase(BaseModel):
 class ArticleResponse(ArticleBase):
     """资讯响应模型（列表项）"""
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ArticleDetailResponse(ArticleBase):
@@ -36,19 +35,25 @@ class ArticleDetailResponse(ArticleBase):
 
     raw_data: Optional[Dict[str, Any]] = Field(None, description="原始数据")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaginationInfo(BaseModel):
     """分页信息模型"""
 
     current_page: int = Field(..., description="当前页码")
-    total_pages: int = Field(..., description="总页数")
-    total_items: int = Field(..., description="总条目数")
+    total_pages: Optional[int] = Field(
+        None, description="总页数，仅在 include_total=true 时返回"
+    )
+    total_items: Optional[int] = Field(
+        None, description="总条目数，仅在 include_total=true 时返回"
+    )
     per_page: int = Field(..., description="每页条数")
     has_next: bool = Field(..., description="是否有下一页")
     has_prev: bool = Field(..., description="是否有上一页")
+    next_cursor: Optional[str] = Field(
+        None, description="下一页游标（服务端签名的不透明字符串），传入 cursor 参数即可继续翻页"
+    )
 
 
 class PaginatedArticlesResponse(BaseModel):
@@ -93,6 +98,10 @@ class ArticleFilters(BaseModel):
     read_status: Optional[str] = Field(
         None, description="已读状态筛选：read, unread, all"
     )
+    cursor: Optional[str] = Field(
+        None, description="keyset 分页游标（须原样使用 next_cursor），提供时优先于 page"
+    )
+    include_total: bool = Field(False, description="是否统计总条目数")
 
 
 # 已读状态相关模型
@@ -102,12 +111,25 @@ class ReadStatusRequest(BaseModel):
     is_read: bool = Field(..., description="是否已读：True=已读，False=未读")
 
 
+# 单次批量设置已读状态的资讯数量上限（去重后）
+MAX_BATCH_POST_IDS = 1000
+
+
 class BatchReadStatusRequest(BaseModel):
     """批量已读状态请求模型"""
 
-    post_ids: List[str] = Field(..., description="资讯ID列表")
+    post_ids: List[str] = Field(..., description="资讯ID列表，重复的ID只处理一次")
     is_read: bool = Field(..., description="是否已读：True=已读，False=未读")
 
+    @field_validator("post_ids")
+    @classmethod
+    def _dedupe_post_ids(cls, post_ids: List[str]) -> List[str]:
+        """按首次出现顺序去重，并限制单次请求的资讯数量"""
+        unique_ids = list(dict.fromkeys(post_ids))
+        if len(unique_ids) > MAX_BATCH_POST_IDS:
+            raise ValueError(f"单次最多设置 {MAX_BATCH_POST_IDS} 篇资讯的已读状态")
+        return unique_ids
+
 
 class ReadStatusResponse(BaseModel):
     """已读状态响应模型"""
@@ -117,8 +139,7 @@ class ReadStatusResponse(BaseModel):
     read_at: Optional[datetime] = Field(None, description="标记已读时间")
     updated_at: datetime = Field(..., description="最后更新时间")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BatchReadStatusResponse(BaseModel):
@@ -135,5 +156,4 @@ class ArticleWithReadStatus(ArticleBase):
     is_read: bool = Field(False, description="是否已读")
     read_at: Optional[datetime] = Field(None, description="标记已读时间")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
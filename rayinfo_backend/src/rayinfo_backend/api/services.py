@@ -5,11 +5,16 @@
 
 from __future__ import annotations
 
-import math
-from typing import List, Optional
+import threading
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy.engine import Row
 from datetime import datetime
 
-from ..api.repositories import ArticleRepository
+from ..api.repositories import STREAM_BATCH_SIZE, ArticleRepository
+from .cursor_utils import encode_cursor
 from .schemas import (
     ArticleResponse,
     ArticleDetailResponse,
@@ -17,7 +22,6 @@ from .schemas import (
     PaginatedArticlesResponse,
     PaginationInfo,
     SourcesResponse,
-    SourceStats,
     ArticleFilters,
     ReadStatusRequest,
     ReadStatusResponse,
@@ -25,6 +29,38 @@ from .schemas import (
     BatchReadStatusResponse,
 )
 from ..models.info_item import RawInfoItem, ArticleReadStatus
+from ..utils.change_hooks import on_articles_changed
+from ..utils.ttl_cache import TTLCache
+
+# 整页资讯一次性校验，复用同一个列表校验器
+_ARTICLES_WITH_STATUS_ADAPTER = TypeAdapter(List[ArticleWithReadStatus])
+
+# 来源统计需要全表 GROUP BY，结果变化缓慢，短时间缓存即可；
+# 同时缓存响应模型和序列化后的 JSON，接口命中时直接返回字节串
+_SOURCES_STATS_CACHE = TTLCache(maxsize=2, ttl=30)
+_SOURCES_STATS_KEY = "sources_stats_v1"
+_SOURCES_STATS_JSON_KEY = "sources_stats_v1:json"
+
+
+# 资讯列表页和搜索结果按筛选参数缓存序列化后的响应，写入资讯或已读状态后整体失效
+_ARTICLE_PAGES_CACHE = TTLCache(maxsize=256, ttl=15)
+
+# 总条目数只与筛选条件有关，翻页时复用首次统计的结果
+_TOTAL_COUNT_CACHE = TTLCache(maxsize=256, ttl=30)
+_COUNT_KEY_FIELDS = {"source", "query", "start_date", "end_date", "read_status"}
+
+
+@on_articles_changed
+def invalidate_sources_stats_cache() -> None:
+    """清除来源统计缓存，在写入新资讯后调用"""
+    _SOURCES_STATS_CACHE.invalidate()
+
+
+@on_articles_changed
+def invalidate_article_pages_cache() -> None:
+    """清除资讯列表页和总数缓存，在写入新资讯或修改已读状态后调用"""
+    _ARTICLE_PAGES_CACHE.invalidate()
+    _TOTAL_COUNT_CACHE.invalidate()
 
 
 class ArticleService:
@@ -54,31 +90,91 @@ class ArticleService:
             PaginatedArticlesResponse: 分页资讯响应
         """
         # 始终使用带已读状态的查询，以确保前端能获取到已读状态信息
-        articles_with_status, total_count = (
-            self.repository.get_articles_with_read_status(filters)
+        articles_with_status, total_count, next_cursor = self._with_cached_total(
+            filters, "articles", self.repository.get_articles_with_read_status
         )
         # 转换为带已读状态的响应模型
-        article_responses = [
-            self._convert_to_article_with_status_response(article, read_status)
-            for article, read_status in articles_with_status
-        ]
-
-        # 计算分页信息
-        total_pages = math.ceil(total_count / filters.limit) if total_count > 0 else 1
-        has_next = filters.page < total_pages
-        has_prev = filters.page > 1
-
-        pagination_info = PaginationInfo(
-            current_page=filters.page,
-            total_pages=total_pages,
-            total_items=total_count,
-            per_page=filters.limit,
-            has_next=has_next,
-            has_prev=has_prev,
+        article_responses = self._convert_to_article_with_status_responses(
+            articles_with_status
         )
 
         return PaginatedArticlesResponse(
-            data=article_responses, pagination=pagination_info
+            data=article_responses,
+            pagination=self._build_pagination(filters, total_count, next_cursor),
+        )
+
+    def stream_articles(self, filters: ArticleFilters) -> Iterator[bytes]:
+        """以 JSON 分块流式输出资讯列表
+
+        输出结构与 PaginatedArticlesResponse 相同，资讯逐条序列化后立即写出，
+        分页信息放在列表之后，单个请求不再同时持有整页的模型对象。流式输出
+        不统计总数，total_items / total_pages 始终为 null。
+
+        Args:
+            filters: 筛选和分页参数
+
+        Returns:
+            Iterator[bytes]: JSON 片段迭代器
+
+        Raises:
+            ValueError: 游标不合法（在开始输出前抛出）
+        """
+        rows = self.repository.iter_articles_with_read_status(filters)
+        return self._encode_article_stream(rows, filters)
+
+    def _encode_article_stream(
+        self, rows: Iterator, filters: ArticleFilters
+    ) -> Iterator[bytes]:
+        """将 (资讯, 已读状态) 行编码为 JSON 片段
+
+        每读取一批行合并输出一个片段：同步迭代器的每个片段都要在线程池中
+        取一次，逐条输出会为每条资讯多付一次线程切换和一次发送。
+        """
+        chunk = bytearray(b'{"data":[')
+        last_article: Optional[RawInfoItem] = None
+        has_next = False
+        for index, (article, read_status) in enumerate(rows):
+            if index == filters.limit:
+                # 多取的一条只用于判断是否还有下一页
+                has_next = True
+                break
+            if index:
+                if index % STREAM_BATCH_SIZE == 0:
+                    yield bytes(chunk)
+                    chunk.clear()
+                chunk += b","
+            item = self._convert_to_article_with_status_response(article, read_status)
+            chunk += item.model_dump_json().encode("utf-8")
+            last_article = article
+
+        next_cursor = None
+        if has_next and last_article is not None:
+            next_cursor = encode_cursor(last_article.collected_at, last_article.post_id)
+        pagination_info = self._build_pagination(filters, None, next_cursor)
+        chunk += b'],"pagination":'
+        chunk += pagination_info.model_dump_json().encode("utf-8")
+        chunk += b"}"
+        yield bytes(chunk)
+
+    def get_articles_paginated_json(self, filters: ArticleFilters) -> bytes:
+        """获取序列化后的分页资讯列表
+
+        相同筛选参数的请求在缓存有效期内直接返回上次的 JSON。
+
+        Args:
+            filters: 筛选和分页参数
+
+        Returns:
+            bytes: PaginatedArticlesResponse 的 JSON 编码
+
+        Raises:
+            ValueError: 游标不合法
+        """
+        return _ARTICLE_PAGES_CACHE.get_or_set(
+            filters.model_dump_json(),
+            lambda: self.get_articles_paginated(filters)
+            .model_dump_json()
+            .encode("utf-8"),
         )
 
     def get_article_detail(self, post_id: str) -> Optional[ArticleDetailResponse]:
@@ -108,37 +204,113 @@ class ArticleService:
         Returns:
             PaginatedArticlesResponse: 分页搜索结果
         """
-        # 从数据访问层获取搜索结果
-        articles, total_count = self.repository.search_articles(search_query, filters)
+        # 从数据访问层获取搜索结果（已连接已读状态）
+        articles_with_status, total_count, next_cursor = self._with_cached_total(
+            filters,
+            f"search:{search_query}",
+            lambda query_filters: self.repository.search_articles(
+                search_query, query_filters
+            ),
+        )
+
+        # 转换为带已读状态的响应模型
+        article_responses = self._convert_to_article_with_status_responses(
+            articles_with_status
+        )
+
+        return PaginatedArticlesResponse(
+            data=article_responses,
+            pagination=self._build_pagination(filters, total_count, next_cursor),
+        )
+
+    def search_articles_json(
+        self, search_query: str, filters: ArticleFilters
+    ) -> bytes:
+        """获取序列化后的搜索结果
+
+        与资讯列表页共用缓存，修改已读状态或写入新资讯后一并失效。
+
+        Args:
+            search_query: 搜索关键词
+            filters: 筛选和分页参数
 
-        # 计算分页信息
-        total_pages = math.ceil(total_count / filters.limit) if total_count > 0 else 1
-        has_next = filters.page < total_pages
-        has_prev = filters.page > 1
+        Returns:
+            bytes: PaginatedArticlesResponse 的 JSON 编码
 
-        # 批量获取已读状态并转换为响应模型
-        read_status_map = self.repository.get_read_status_map(
-            [article.post_id for article in articles]
+        Raises:
+            ValueError: 游标不合法
+        """
+        return _ARTICLE_PAGES_CACHE.get_or_set(
+            ("search", search_query, filters.model_dump_json()),
+            lambda: self.search_articles(search_query, filters)
+            .model_dump_json()
+            .encode("utf-8"),
         )
 
-        article_responses = [
-            self._convert_to_article_with_status_response(
-                article, read_status_map.get(article.post_id)
+    def _with_cached_total(
+        self,
+        filters: ArticleFilters,
+        scope: str,
+        fetch: Callable[[ArticleFilters], Tuple[List, Optional[int], Optional[str]]],
+    ) -> Tuple[List, Optional[int], Optional[str]]:
+        """执行分页查询，总数命中缓存时跳过 COUNT
+
+        Args:
+            filters: 筛选和分页参数
+            scope: 区分列表和搜索等不同查询的缓存键前缀
+            fetch: 实际执行查询的仓储方法
+
+        Returns:
+            Tuple[List, Optional[int], Optional[str]]: (结果列表, 总数量, 下一页游标)
+        """
+        if not filters.include_total:
+            return fetch(filters)
+
+        count_key = (scope, filters.model_dump_json(include=_COUNT_KEY_FIELDS))
+        cached_total = _TOTAL_COUNT_CACHE.get(count_key)
+        if cached_total is not None:
+            rows, _, next_cursor = fetch(
+                filters.model_copy(update={"include_total": False})
             )
-            for article in articles
-        ]
+            return rows, cached_total, next_cursor
+
+        generation = _TOTAL_COUNT_CACHE.generation
+        rows, total_count, next_cursor = fetch(filters)
+        if total_count is not None:
+            _TOTAL_COUNT_CACHE.set(count_key, total_count, generation=generation)
+        return rows, total_count, next_cursor
+
+    @staticmethod
+    def _build_pagination(
+        filters: ArticleFilters,
+        total_count: Optional[int],
+        next_cursor: Optional[str],
+    ) -> PaginationInfo:
+        """计算分页信息
+
+        是否有下一页由仓储层多取一条判断；总数按需统计，未统计时总页数也为None。
 
-        pagination_info = PaginationInfo(
+        Args:
+            filters: 筛选和分页参数
+            total_count: 总数量
+            next_cursor: 下一页游标
+
+        Returns:
+            PaginationInfo: 分页信息
+        """
+        total_pages = None
+        if total_count is not None:
+            # 整数向上取整，空结果也算一页
+            total_pages = max(1, (total_count + filters.limit - 1) // filters.limit)
+
+        return PaginationInfo(
             current_page=filters.page,
             total_pages=total_pages,
             total_items=total_count,
             per_page=filters.limit,
-            has_next=has_next,
-            has_prev=has_prev,
-        )
-
-        return PaginatedArticlesResponse(
-            data=article_responses, pagination=pagination_info
+            has_next=next_cursor is not None,
+            has_prev=filters.page > 1,
+            next_cursor=next_cursor,
         )
 
     def get_sources_stats(self) -> SourcesResponse:
@@ -147,21 +319,31 @@ class ArticleService:
         Returns:
             SourcesResponse: 来源统计响应
         """
-        # 从数据访问层获取统计数据
-        stats_data = self.repository.get_sources_stats()
-
-        # 转换为响应模型
-        source_stats = [
-            SourceStats(
-                name=stat["name"],
-                display_name=stat["display_name"],
-                count=stat["count"],
-                latest_update=stat["latest_update"],
-            )
-            for stat in stats_data
-        ]
+        return _SOURCES_STATS_CACHE.get_or_set(
+            _SOURCES_STATS_KEY, self._load_sources_stats
+        )
+
+    def get_sources_stats_json(self) -> bytes:
+        """获取序列化后的来源统计信息
+
+        Returns:
+            bytes: SourcesResponse 的 JSON 编码
+        """
+        return _SOURCES_STATS_CACHE.get_or_set(
+            _SOURCES_STATS_JSON_KEY,
+            lambda: self.get_sources_stats().model_dump_json().encode("utf-8"),
+        )
+
+    def _load_sources_stats(self) -> SourcesResponse:
+        """从数据库聚合来源统计信息
+
+        Returns:
+            SourcesResponse: 来源统计响应
+        """
+        return SourcesResponse(sources=self.repository.get_sources_stats())
 
-        return SourcesResponse(sources=source_stats)
+    # 单条转换使用 model_construct：数据来自数据库中已校验过的行，跳过校验，
+    # 直接取 ORM 对象已加载的列值（__dict__，未映射的键会被忽略）。
 
     def _convert_to_article_response(self, article: RawInfoItem) -> ArticleResponse:
         """将数据库模型转换为API响应模型
@@ -172,7 +354,32 @@ class ArticleService:
         Returns:
             ArticleResponse: API响应模型
         """
-        return ArticleResponse.model_validate(article)
+        return ArticleResponse.model_construct(**article.__dict__)
+
+    def _convert_to_article_with_status_responses(
+        self, rows: Iterable[Tuple[RawInfoItem, Optional[ArticleReadStatus]]]
+    ) -> List[ArticleWithReadStatus]:
+        """将整页 (资讯, 已读状态) 行批量转换为响应模型
+
+        直接读取 ORM 对象已加载的列值（__dict__），绕过逐属性的 instrumentation
+        访问，再由列表 TypeAdapter 在 pydantic-core 中一次完成整页校验。
+
+        Args:
+            rows: (资讯, 已读状态) 行
+
+        Returns:
+            List[ArticleWithReadStatus]: 包含已读状态的API响应模型列表
+        """
+        return _ARTICLES_WITH_STATUS_ADAPTER.validate_python(
+            [
+                {
+                    **article.__dict__,
+                    "is_read": read_status.is_read if read_status else False,
+                    "read_at": read_status.read_at if read_status else None,
+                }
+                for article, read_status in rows
+            ]
+        )
 
     def _convert_to_article_with_status_response(
         self, article: RawInfoItem, read_status: Optional[ArticleReadStatus]
@@ -186,21 +393,11 @@ class ArticleService:
         Returns:
             ArticleWithReadStatus: 包含已读状态的API响应模型
         """
-        # 先创建一个包含已读状态的字典
-        article_dict = {
-            "post_id": article.post_id,
-            "source": article.source,
-            "title": article.title,
-            "url": article.url,
-            "description": article.description,
-            "query": article.query,
-            "engine": article.engine,
-            "collected_at": article.collected_at,
-            "processed": article.processed,
-            "is_read": read_status.is_read if read_status else False,
-            "read_at": read_status.read_at if read_status else None,
-        }
-        return ArticleWithReadStatus.model_validate(article_dict)
+        return ArticleWithReadStatus.model_construct(
+            **article.__dict__,
+            is_read=read_status.is_read if read_status else False,
+            read_at=read_status.read_at if read_status else None,
+        )
 
     def _convert_to_article_detail_response(
         self, article: RawInfoItem
@@ -213,7 +410,110 @@ class ArticleService:
         Returns:
             ArticleDetailResponse: 详情API响应模型
         """
-        return ArticleDetailResponse.model_validate(article)
+        return ArticleDetailResponse.model_construct(**article.__dict__)
+
+
+@lru_cache(maxsize=1)
+def get_article_service() -> ArticleService:
+    """获取共享的资讯服务实例
+
+    服务和数据访问层本身不保存请求状态（会话在每次调用时创建），
+    可以在所有请求间复用。测试中重置 DatabaseManager 后需调用
+    ``get_article_service.cache_clear()``。
+
+    Returns:
+        ArticleService: 资讯服务单例
+    """
+    return ArticleService()
+
+
+class _PendingReadStatus:
+    """等待合并写入的单条已读状态修改"""
+
+    __slots__ = ("post_id", "is_read", "done", "result", "error")
+
+    def __init__(self, post_id: str, is_read: bool):
+        self.post_id = post_id
+        self.is_read = is_read
+        self.done = False
+        self.result: Optional[Row] = None
+        self.error: Optional[BaseException] = None
+
+
+class ReadStatusWriteCombiner:
+    """合并并发的单条已读状态写入（flat combining）
+
+    用户快速连续标记已读时，每次点击原本各自执行一条 upsert 并提交一次。这里
+    让并发请求先登记到待写列表，由当前没有写入在进行时到达的线程担任写入者，
+    把列表中积攒的修改合并成每种状态一条 upsert 一次写入；其余线程等待自己的
+    修改被写入后再返回。调用方仍同步拿到写入后的状态，资讯不存在时仍返回None。
+    """
+
+    def __init__(self, repository: ArticleRepository, max_batch: int = 500):
+        """初始化合并写入器
+
+        Args:
+            repository: 数据访问层实例
+            max_batch: 单次合并写入的最大修改条数
+        """
+        self.repository = repository
+        self.max_batch = max_batch
+        self._cond = threading.Condition()
+        self._pending: List[_PendingReadStatus] = []
+        self._flushing = False
+
+    def submit(self, post_id: str, is_read: bool) -> Optional[Row]:
+        """登记一条修改并等待其写入
+
+        Args:
+            post_id: 资讯ID
+            is_read: 是否已读
+
+        Returns:
+            Optional[Row]: 写入后的状态行，资讯不存在时返回None
+        """
+        op = _PendingReadStatus(post_id, is_read)
+        with self._cond:
+            self._pending.append(op)
+            while not op.done:
+                if self._flushing:
+                    self._cond.wait()
+                    continue
+
+                self._flushing = True
+                batch = self._pending[: self.max_batch]
+                del self._pending[: self.max_batch]
+                self._cond.release()
+                try:
+                    self._flush(batch)
+                finally:
+                    self._cond.acquire()
+                    self._flushing = False
+                    self._cond.notify_all()
+
+        if op.error is not None:
+            raise op.error
+        return op.result
+
+    def _flush(self, batch: List[_PendingReadStatus]) -> None:
+        """将一批修改按目标状态分组写入，同一资讯以最后一次修改为准"""
+        latest = {op.post_id: op.is_read for op in batch}
+        try:
+            rows = {}
+            for is_read in (True, False):
+                post_ids = [pid for pid, value in latest.items() if value is is_read]
+                if post_ids:
+                    for row in self.repository.update_read_statuses(post_ids, is_read):
+                        rows[row.post_id] = row
+        except Exception as exc:  # noqa: BLE001
+            for op in batch:
+                op.error = exc
+        else:
+            for op in batch:
+                op.result = rows.get(op.post_id)
+        finally:
+            for op in batch:
+                op.done = True
 
 
 class ReadStatusService:
@@ -229,6 +529,7 @@ class ReadStatusService:
             repository: 数据访问层实例，如果为None则创建默认实例
         """
         self.repository = repository or ArticleRepository()
+        self._writes = ReadStatusWriteCombiner(self.repository)
 
     def toggle_read_status(
         self, post_id: str, request: ReadStatusRequest
@@ -242,15 +543,13 @@ class ReadStatusService:
         Returns:
             ReadStatusResponse: 已读状态响应，如果资讯不存在则返回None
         """
-        # 检查资讯是否存在
-        article = self.repository.get_article_by_id(post_id)
-        if not article:
+        # 并发的单条修改合并写入；存在性检查和写入在同一条语句中完成，
+        # 资讯不存在时返回None
+        read_status = self._writes.submit(post_id, request.is_read)
+        if read_status is None:
             return None
+        invalidate_article_pages_cache()
 
-        # 更新已读状态
-        read_status = self.repository.update_read_status(post_id, request.is_read)
-
-        # 转换为响应模型
         return ReadStatusResponse.model_validate(read_status)
 
     def batch_toggle_read_status(
@@ -264,33 +563,16 @@ class ReadStatusService:
         Returns:
             BatchReadStatusResponse: 批量操作结果
         """
-        results = []
-        success_count = 0
-        failed_count = 0
-
-        for post_id in request.post_ids:
-            try:
-                # 检查资讯是否存在
-                article = self.repository.get_article_by_id(post_id)
-                if not article:
-                    failed_count += 1
-                    continue
-
-                # 更新已读状态
-                read_status = self.repository.update_read_status(
-                    post_id, request.is_read
-                )
-
-                # 添加成功结果
-                results.append(ReadStatusResponse.model_validate(read_status))
-                success_count += 1
-
-            except Exception:
-                # 在实际应用中应该记录具体的错误信息
-                failed_count += 1
+        # post_ids 已在请求模型中去重；存在性检查和写入在同一条 upsert 中完成，
+        # 不存在的资讯不会写入，计入失败数量
+        rows = self.repository.update_read_statuses(request.post_ids, request.is_read)
+        failed_count = len(request.post_ids) - len(rows)
+        results = [ReadStatusResponse.model_validate(row) for row in rows]
+        if results:
+            invalidate_article_pages_cache()
 
         return BatchReadStatusResponse(
-            success_count=success_count, failed_count=failed_count, results=results
+            success_count=len(results), failed_count=failed_count, results=results
         )
 
     def get_read_status(self, post_id: str) -> Optional[ReadStatusResponse]:
@@ -307,3 +589,15 @@ class ReadStatusService:
             return None
 
         return ReadStatusResponse.model_validate(read_status)
+
+
+@lru_cache(maxsize=1)
+def get_read_status_service() -> ReadStatusService:
+    """获取共享的已读状态服务实例
+
+    与 ``get_article_service`` 相同，服务不保存请求状态，可在所有请求间复用。
+
+    Returns:
+        ReadStatusService: 已读状态服务单例
+    """
+    return ReadStatusService()
@@ -1,14 +1,25 @@
 """API v1 路由定义。
 
 此模块包含 RayInfo API v1 版本提供的所有 FastAPI 路由端点。
+
+访问数据库的端点声明为普通函数：仓储层使用同步 SQLAlchemy 会话，
+由 FastAPI 放到线程池中执行，避免阻塞事件循环、串行化所有请求。
+端点不再各自捕获异常，未处理的异常由 _ServiceErrorRoute 统一转换为 500。
 """
 
 from __future__ import annotations
 
+import logging
+import re
+import time
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Coroutine, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
 
 from ..schemas import (
     ArticleDetailResponse,
@@ -20,22 +31,97 @@ from ..schemas import (
     ReadStatusResponse,
     SourcesResponse,
 )
-from ..services import ArticleService, ReadStatusService
+from ..services import (
+    ArticleService,
+    ReadStatusService,
+    get_article_service,
+    get_read_status_service,
+)
+from ...utils.display_names import collector_display_name, instance_display_name
 from ...utils.task_catalog import task_catalog
 
-router = APIRouter(prefix="/api/v1", tags=["articles"])
+logger = logging.getLogger("rayinfo.api")
+
+
+def _error_label(label: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """标注端点失败时 500 响应中的错误描述
+
+    Args:
+        label: 操作名称，错误信息形如 "{label}失败: ..."
+
+    Returns:
+        在端点函数上记录错误描述的装饰器，需写在 @router 装饰器之下
+    """
 
+    def decorate(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        endpoint._error_label = label  # type: ignore[attr-defined]
+        return endpoint
 
-def get_article_service() -> ArticleService:
-    """依赖注入：获取文章服务实例"""
+    return decorate
+
+
+class _ServiceErrorRoute(APIRoute):
+    """把端点中未处理的异常统一转换为 500 响应
+
+    只处理用 _error_label 标注过的端点，错误信息以标注的操作名称开头，
+    如 "获取资讯列表失败: ..."。转换发生在路由内部，响应仍经过 CORS 等中间件；
+    HTTPException 和参数校验错误原样抛出。
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        label = getattr(self.endpoint, "_error_label", None)
+        if label is None:
+            return handler
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (HTTPException, RequestValidationError):
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("%s %s 处理失败", request.method, request.url.path)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"{label}失败: {exc}",
+                ) from exc
 
-    return ArticleService()
+        return route_handler
 
 
-def get_read_status_service() -> ReadStatusService:
-    """依赖注入：获取已读状态服务实例"""
+def _resolve_instance_filter(
+    instance_id: Optional[str], source: Optional[str], query: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    """将采集器实例ID换算为来源和关键词筛选
 
-    return ReadStatusService()
+    Args:
+        instance_id: 采集器实例ID，为空时原样返回 source 和 query
+        source: 请求中的来源筛选
+        query: 请求中的关键词筛选
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (来源, 关键词)，实例带参数时以参数作为关键词
+
+    Raises:
+        HTTPException: 实例不存在时返回 404
+    """
+    if not instance_id:
+        return source, query
+
+    # 只需实例对应的来源和参数，查扁平索引即可，不加载执行状态
+    resolved = task_catalog.flat_index().get(instance_id)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail=f"采集器实例 {instance_id} 不存在")
+    source, param = resolved
+    return source, param or query
+
+
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["articles"],
+    default_response_class=ORJSONResponse,
+    route_class=_ServiceErrorRoute,
+)
 
 
 @router.get(
@@ -44,8 +130,11 @@ def get_read_status_service() -> ReadStatusService:
     summary="获取资讯列表",
     description="获取分页的资讯列表，支持来源筛选、实例ID筛选、关键词筛选和日期范围筛选",
 )
-async def get_articles(
-    page: int = Query(1, ge=1, description="页码"),
+@_error_label("获取资讯列表")
+def get_articles(
+    page: int = Query(
+        1, ge=1, deprecated=True, description="页码（已弃用，请改用 cursor 翻页）"
+    ),
     limit: int = Query(20, ge=1, le=100, description="每页条数"),
     source: Optional[str] = Query(None, description="来源筛选"),
     instance_id: Optional[str] = Query(None, description="采集器实例ID筛选"),
@@ -55,22 +144,17 @@ async def get_articles(
     read_status: Optional[str] = Query(
         None, description="已读状态筛选：read, unread, all"
     ),
+    cursor: Optional[str] = Query(
+        None, description="分页游标（取自上一页的 next_cursor），提供时忽略 page"
+    ),
+    include_total: bool = Query(False, description="是否返回总条目数和总页数"),
     service: ArticleService = Depends(get_article_service),
 ):
     """获取分页资讯列表"""
 
-    try:
-        if instance_id:
-            instance = task_catalog.get_instance(instance_id)
-            if instance:
-                source = instance.collector.name
-                if instance.param:
-                    query = instance.param
-            else:
-                raise HTTPException(
-                    status_code=404, detail=f"采集器实例 {instance_id} 不存在"
-                )
+    source, query = _resolve_instance_filter(instance_id, source, query)
 
+    try:
         filters = ArticleFilters(
             page=page,
             limit=limit,
@@ -79,49 +163,92 @@ async def get_articles(
             start_date=start_date,
             end_date=end_date,
             read_status=read_status,
+            cursor=cursor,
+            include_total=include_total,
         )
 
-        result = service.get_articles_paginated(filters)
-        return result
+        # 相同筛选参数短时间内直接返回缓存的 JSON
+        return Response(
+            content=service.get_articles_paginated_json(filters),
+            media_type="application/json",
+        )
 
-    except HTTPException:
-        raise
-    except Exception as exc:  # noqa: BLE001
+    except ValueError as exc:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"获取资讯列表失败: {exc}",
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
 
 
+@router.get(
+    "/articles/stream",
+    response_class=StreamingResponse,
+    summary="流式获取资讯列表",
+    description="与 /articles 参数和返回结构相同，按条分块输出 JSON，不统计总数",
+)
+async def stream_articles(
+    page: int = Query(
+        1, ge=1, deprecated=True, description="页码（已弃用，请改用 cursor 翻页）"
+    ),
+    limit: int = Query(20, ge=1, le=100, description="每页条数"),
+    source: Optional[str] = Query(None, description="来源筛选"),
+    instance_id: Optional[str] = Query(None, description="采集器实例ID筛选"),
+    query: Optional[str] = Query(None, description="关键词筛选"),
+    start_date: Optional[datetime] = Query(None, description="开始日期"),
+    end_date: Optional[datetime] = Query(None, description="结束日期"),
+    read_status: Optional[str] = Query(
+        None, description="已读状态筛选：read, unread, all"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="分页游标（取自上一页的 next_cursor），提供时忽略 page"
+    ),
+    service: ArticleService = Depends(get_article_service),
+):
+    """流式获取分页资讯列表"""
+
+    source, query = _resolve_instance_filter(instance_id, source, query)
+
+    try:
+        filters = ArticleFilters(
+            page=page,
+            limit=limit,
+            source=source,
+            query=query,
+            start_date=start_date,
+            end_date=end_date,
+            read_status=read_status,
+            cursor=cursor,
+        )
+        chunks = service.stream_articles(filters)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+
+    # 同步迭代器由 Starlette 放到线程池中消费，不阻塞事件循环
+    return StreamingResponse(chunks, media_type="application/json")
+
+
 @router.put(
     "/articles/{post_id}/read-status",
     response_model=ReadStatusResponse,
     summary="切换资讯已读状态",
     description="手动切换单篇资讯的已读/未读状态",
 )
-async def toggle_article_read_status(
+@_error_label("更新已读状态")
+def toggle_article_read_status(
     post_id: str,
     request: ReadStatusRequest,
     service: ReadStatusService = Depends(get_read_status_service),
 ):
     """切换资讯已读状态"""
 
-    try:
-        result = service.toggle_read_status(post_id, request)
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"资讯 {post_id} 不存在",
-            )
-        return result
-
-    except HTTPException:
-        raise
-    except Exception as exc:  # noqa: BLE001
+    result = service.toggle_read_status(post_id, request)
+    if not result:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"更新已读状态失败: {exc}",
-        ) from exc
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"资讯 {post_id} 不存在",
+        )
+    return result
 
 
 @router.get(
@@ -130,27 +257,21 @@ async def toggle_article_read_status(
     summary="获取资讯已读状态",
     description="获取单篇资讯的已读状态信息",
 )
-async def get_article_read_status(
+@_error_label("获取已读状态")
+def get_article_read_status(
     post_id: str, service: ReadStatusService = Depends(get_read_status_service)
 ):
     """获取资讯已读状态"""
 
-    try:
-        result = service.get_read_status(post_id)
-        if not result:
-            return ReadStatusResponse(
-                post_id=post_id,
-                is_read=False,
-                read_at=None,
-                updated_at=datetime.now(),
-            )
-        return result
-
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"获取已读状态失败: {exc}",
-        ) from exc
+    result = service.get_read_status(post_id)
+    if not result:
+        return ReadStatusResponse(
+            post_id=post_id,
+            is_read=False,
+            read_at=None,
+            updated_at=datetime.now(),
+        )
+    return result
 
 
 @router.put(
@@ -159,21 +280,20 @@ async def get_article_read_status(
     summary="批量设置资讯已读状态",
     description="批量设置多篇资讯的已读/未读状态",
 )
-async def batch_toggle_read_status(
+@_error_label("批量更新已读状态")
+def batch_toggle_read_status(
     request: BatchReadStatusRequest,
     service: ReadStatusService = Depends(get_read_status_service),
 ):
     """批量设置资讯已读状态"""
 
-    try:
-        result = service.batch_toggle_read_status(request)
-        return result
+    result = service.batch_toggle_read_status(request)
+    # 结果可能包含上千条带时间戳的记录，直接序列化为 JSON 返回，跳过响应模型校验
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"批量更新已读状态失败: {exc}",
-        ) from exc
+
+# 搜索关键词中的连续空白和控制字符
+_SEARCH_NOISE = re.compile(r"[\s\x00-\x1f\x7f]+")
 
 
 @router.get(
@@ -182,17 +302,31 @@ async def batch_toggle_read_status(
     summary="搜索资讯",
     description="根据关键词搜索资讯，支持标题、描述和查询字段的模糊匹配",
 )
-async def search_articles(
+@_error_label("搜索资讯")
+def search_articles(
     q: str = Query(..., description="搜索关键词"),
-    page: int = Query(1, ge=1, description="页码"),
+    page: int = Query(
+        1, ge=1, deprecated=True, description="页码（已弃用，请改用 cursor 翻页）"
+    ),
     limit: int = Query(20, ge=1, le=100, description="每页条数"),
     source: Optional[str] = Query(None, description="来源筛选"),
     start_date: Optional[datetime] = Query(None, description="开始日期"),
     end_date: Optional[datetime] = Query(None, description="结束日期"),
+    cursor: Optional[str] = Query(
+        None, description="分页游标（取自上一页的 next_cursor），提供时忽略 page"
+    ),
+    include_total: bool = Query(False, description="是否返回总条目数和总页数"),
     service: ArticleService = Depends(get_article_service),
 ):
     """搜索资讯"""
 
+    # 折叠空白和控制字符；空关键词会退化为匹配全部资讯的 LIKE '%%'，直接拒绝
+    q = _SEARCH_NOISE.sub(" ", q).strip()
+    if not q:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="搜索关键词不能为空"
+        )
+
     try:
         filters = ArticleFilters(
             page=page,
@@ -202,15 +336,19 @@ async def search_articles(
             start_date=start_date,
             end_date=end_date,
             read_status=None,
+            cursor=cursor,
+            include_total=include_total,
         )
 
-        result = service.search_articles(q, filters)
-        return result
+        # 相同关键词和筛选参数短时间内直接返回缓存的 JSON
+        return Response(
+            content=service.search_articles_json(q, filters),
+            media_type="application/json",
+        )
 
-    except Exception as exc:  # noqa: BLE001
+    except ValueError as exc:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"搜索资讯失败: {exc}",
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
 
 
@@ -220,31 +358,43 @@ async def search_articles(
     summary="获取来源统计",
     description="获取所有资讯来源的统计信息，包括数量和最新更新时间",
 )
-async def get_sources_stats(
+@_error_label("获取来源统计")
+def get_sources_stats(
     service: ArticleService = Depends(get_article_service),
 ):
     """获取来源统计信息"""
 
-    try:
-        result = service.get_sources_stats()
-        return result
+    # 缓存中保存的是序列化后的 JSON，直接返回以跳过响应模型校验和编码
+    return Response(
+        content=service.get_sources_stats_json(), media_type="application/json"
+    )
 
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"获取来源统计失败: {exc}",
-        ) from exc
+
+# 健康检查响应体缓存：(生成时的 monotonic 时间, JSON 字节)，最多每秒刷新一次
+_HEALTH_CACHE: tuple[float, bytes] = (float("-inf"), b"")
 
 
 @router.get("/health", summary="健康检查", description="API健康状态检查")
 async def health_check():
-    """API 健康检查端点"""
-
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "version": "v1",
-    }
+    """API 健康检查端点
+
+    负载均衡器会高频轮询此端点，响应体按秒缓存，避免每次请求都格式化时间并序列化。
+    """
+
+    global _HEALTH_CACHE
+    now = time.monotonic()
+    if now - _HEALTH_CACHE[0] >= 1.0:
+        _HEALTH_CACHE = (
+            now,
+            orjson.dumps(
+                {
+                    "status": "healthy",
+                    "timestamp": datetime.now(),
+                    "version": "v1",
+                }
+            ),
+        )
+    return Response(content=_HEALTH_CACHE[1], media_type="application/json")
 
 
 @router.get(
@@ -253,80 +403,27 @@ async def health_check():
     summary="获取资讯详情",
     description="根据资讯ID获取详细信息，包含完整的原始数据",
 )
-async def get_article_detail(
+@_error_label("获取资讯详情")
+def get_article_detail(
     post_id: str, service: ArticleService = Depends(get_article_service)
 ):
     """获取资讯详情"""
 
-    try:
-        result = service.get_article_detail(post_id)
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"资讯 {post_id} 不存在",
-            )
-        return result
-
-    except HTTPException:
-        raise
-    except Exception as exc:  # noqa: BLE001
+    result = service.get_article_detail(post_id)
+    if not result:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"获取资讯详情失败: {exc}",
-        ) from exc
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"资讯 {post_id} 不存在",
+        )
+    return result
 
 
 @router.get("/collectors", summary="按类型分组列出采集器")
 async def list_collectors_by_type():
     """按采集器类型分组列出采集器实例。"""
 
-    instances = task_catalog.list_instances()
-    collectors_by_type: dict[str, dict[str, Any]] = {}
-
-    for instance_id, instance_info in instances.items():
-        collector_name = instance_info.collector_name
-
-        if collector_name not in collectors_by_type:
-            collectors_by_type[collector_name] = {
-                "collector_name": collector_name,
-                "display_name": _get_collector_display_name(collector_name),
-                "total_instances": 0,
-                "instances": [],
-            }
-
-        instance_payload = instance_info.to_dict()
-        instance_payload.update(
-            {
-                "instance_id": instance_id,
-                "display_name": _get_instance_display_name(
-                    collector_name, instance_info.param
-                ),
-            }
-        )
-
-        collectors_by_type[collector_name]["instances"].append(instance_payload)
-        collectors_by_type[collector_name]["total_instances"] += 1
-
-    return {
-        "total_collectors": len(collectors_by_type),
-        "collectors": collectors_by_type,
-    }
-
-
-def _get_collector_display_name(collector_name: str) -> str:
-    """获取采集器的显示名称"""
-
-    display_names = {
-        "mes.search": "搜索引擎",
-        "weibo.home": "微博首页",
-        "rss.feed": "RSS订阅",
-    }
-    return display_names.get(collector_name, collector_name)
-
-
-def _get_instance_display_name(collector_name: str, param: str | None) -> str:
-    """获取实例的显示名称"""
-
-    if param is None:
-        return _get_collector_display_name(collector_name)
-    return param
+    # 分组结果由 task_catalog 缓存，任务表或执行状态变化时才重新构建；
+    # 直接交给 orjson，跳过 jsonable_encoder 对整个快照的逐层遍历
+    return ORJSONResponse(
+        task_catalog.grouped_snapshot(collector_display_name, instance_display_name)
+    )
@@ -11,14 +11,16 @@
 
 from __future__ import annotations
 
+import sys
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Protocol
+from typing import Any, AsyncIterator, Final
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from rayinfo_backend.collectors.mes.mes_executor import MesExecutor
+from rayinfo_backend.collectors.mes.mes_executor import get_mes_executor
 from rayinfo_backend.ray_scheduler import registry
 from rayinfo_backend.config.settings import get_settings
 
@@ -26,40 +28,48 @@ from . import state
 from .utils.logging import setup_logging
 from .api.v1 import router as api_v1_router
 from .ray_scheduler import RayScheduler
+from .utils.display_names import collector_display_name, instance_display_name
 from .utils.task_catalog import task_catalog
 
 logger = setup_logging()
 
+# TaskConsumer 在导入时注册一次：构造开销很小且不依赖事件循环，
+# 注册表在 lifespan 启动调度器之前就已完整，多次进入 lifespan 也不会重复注册。
+# 注册模块单例，使配额状态和结果缓存与便利函数 execute_mes_command 共享
+registry.register(get_mes_executor())
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: D401 (fastapi 兼容)
-    """应用生命周期：启动调度器 & 关闭清理。"""
+    """应用生命周期：启动调度器 & 关闭清理。
+
+    RayScheduler 在应用所在的事件循环中运行，由 uvicorn 以 uvloop 启动时
+    （见文件末尾的入口和 run_backend.sh），调度器的定时器和采集请求同样使用 uvloop。
+    """
     logger.info("Application starting ...")
 
-    # 解析配置文件（尽早进行，以便初始化数据库路径等依赖）
+    # 解析配置文件（尽早进行，以便初始化数据库路径等依赖；get_settings 进程内只解析一次）
     settings = get_settings()
 
-    # 注册 TaskConsumer
-    registry.register(MesExecutor())
-
-    # 准备调度任务定义
-    task_definitions = [
-        {
-            "source": "mes.search",
-            "interval_seconds": item.interval_seconds,
-            "args": {
-                "query": item.query,
-                "engine": item.engine,
-                "time_range": item.time_range,
-            },
-        }
-        for item in settings.search_engine
-    ]
-
-    # 初始化调度器并加载任务表
-    scheduler = RayScheduler(db_path=settings.storage.db_path)
+    # 初始化调度器并加载任务表，任务定义由生成器逐条产出，不构建中间列表
+    scheduler = RayScheduler(
+        db_path=settings.storage.db_path,
+        max_concurrency=settings.scheduler_max_concurrency,
+    )
     state.set_scheduler(scheduler)
     try:
-        scheduler.load_tasks(task_definitions)
+        scheduler.load_tasks(
+            {
+                "source": "mes.search",
+                "interval_seconds": item.interval_seconds,
+                "args": {
+                    "query": item.query,
+                    "engine": item.engine,
+                    "time_range": item.time_range,
+                },
+            }
+            for item in settings.search_engine
+        )
         await scheduler.start()
         logger.info(
             "RayScheduler started with %d tasks", scheduler.get_queue_size()
@@ -87,6 +97,8 @@ app = FastAPI(
     description="RayInfo 跨平台资讯聚合器 API",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson 序列化大列表响应明显快于标准库 json
+    default_response_class=ORJSONResponse,
 )
 
 # 添加 CORS 支持
@@ -107,8 +119,29 @@ async def root():
     return {"message": "Hello RayInfo"}
 
 
+# 当前时间戳字符串缓存：(生成时的 monotonic 时间, ISO 字符串)，最多每秒刷新一次
+_TIMESTAMP_CACHE: tuple[float, str] = (float("-inf"), "")
+
+
+def _cached_timestamp() -> str:
+    """获取按秒缓存的当前 UTC 时间 ISO 字符串"""
+
+    global _TIMESTAMP_CACHE
+    now = time.monotonic()
+    if now - _TIMESTAMP_CACHE[0] >= 1.0:
+        _TIMESTAMP_CACHE = (now, datetime.now(timezone.utc).isoformat())
+    return _TIMESTAMP_CACHE[1]
+
+
+# /status 响应中的固定字段
+_STATUS_TEMPLATE: Final[dict[str, Any]] = {
+    "message": "RayInfo Backend Service is running",
+    "scheduler_type": "RayScheduler",
+}
+
+
 @app.get("/status")
-async def get_status() -> dict[str, Any]:
+async def get_status() -> ORJSONResponse:
     """获取系统状态信息。
 
     返回:
@@ -117,9 +150,9 @@ async def get_status() -> dict[str, Any]:
     current_scheduler = state.get_scheduler()
 
     status: dict[str, Any] = {
-        "message": "RayInfo Backend Service is running",
-        "scheduler_type": "RayScheduler",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        **_STATUS_TEMPLATE,
+        # 状态接口常被监控高频轮询，时间戳精确到秒即可
+        "timestamp": _cached_timestamp(),
         "scheduler_running": current_scheduler.is_running()
         if current_scheduler
         else False,
@@ -128,18 +161,17 @@ async def get_status() -> dict[str, Any]:
     }
 
     if current_scheduler:
-        snapshot = current_scheduler.get_tasks_snapshot()
-        status["registered_jobs"] = len(snapshot)
-
-        now = datetime.now(timezone.utc)
-        status["pending_tasks"] = sum(
-            1 for entry in snapshot.values() if entry["next_run_at"] <= now
+        # 直接遍历任务表一次，不复制快照
+        status["registered_jobs"] = current_scheduler.get_queue_size()
+        pending_tasks, next_task_time = current_scheduler.get_schedule_summary(
+            datetime.now(timezone.utc)
         )
-
-        next_task_time = current_scheduler.get_next_task_time()
+        status["pending_tasks"] = pending_tasks
         if next_task_time:
-            status["next_task_time"] = next_task_time.isoformat()
-    return status
+            # datetime 交给 orjson 直接序列化
+            status["next_task_time"] = next_task_time
+    # 直接返回响应对象，跳过 FastAPI 对返回值的 jsonable_encoder 遍历
+    return ORJSONResponse(status)
 
 
 @app.get("/instances", summary="列出所有采集器实例")
@@ -149,11 +181,9 @@ async def list_instances():
     Returns:
         dict: 包含所有实例信息的字典，键为实例ID，值为实例详情
     """
-    instances = task_catalog.list_instances()
-    return {
-        "total_count": len(instances),
-        "instances": {iid: data.to_dict() for iid, data in instances.items()},
-    }
+    # 实例字典由 task_catalog 缓存，任务表或执行状态变化时才重新构建；
+    # 内容均为 JSON 原生类型，直接交给 orjson，跳过 jsonable_encoder 的逐层遍历
+    return ORJSONResponse(task_catalog.instances_snapshot())
 
 
 @app.get("/collectors", summary="按类型分组列出采集器")
@@ -163,54 +193,10 @@ async def list_collectors_by_type():
     Returns:
         dict: 按采集器类型分组的实例信息
     """
-    instances = task_catalog.list_instances()
-    collectors_by_type: dict[str, dict[str, Any]] = {}
-
-    for instance_id, snapshot in instances.items():
-        collector_name = snapshot.collector_name
-        if collector_name not in collectors_by_type:
-            collectors_by_type[collector_name] = {
-                "collector_name": collector_name,
-                "display_name": _get_collector_display_name(collector_name),
-                "total_instances": 0,
-                "instances": [],
-            }
-
-        payload = snapshot.to_dict()
-        payload.update(
-            {
-                "instance_id": instance_id,
-                "display_name": _get_instance_display_name(
-                    collector_name, snapshot.param
-                ),
-            }
-        )
-        collectors_by_type[collector_name]["instances"].append(payload)
-        collectors_by_type[collector_name]["total_instances"] += 1
-
-    return {
-        "total_collectors": len(collectors_by_type),
-        "collectors": collectors_by_type,
-    }
-
-
-def _get_collector_display_name(collector_name: str) -> str:
-    """获取采集器的显示名称"""
-
-    display_names = {
-        "mes.search": "搜索引擎",
-        "weibo.home": "微博首页",
-        "rss.feed": "RSS订阅",
-    }
-    return display_names.get(collector_name, collector_name)
-
-
-def _get_instance_display_name(collector_name: str, param: str | None) -> str:
-    """获取实例的显示名称"""
-
-    if param is None:
-        return _get_collector_display_name(collector_name)
-    return param
+    # 分组结果由 task_catalog 缓存，任务表或执行状态变化时才重新构建
+    return ORJSONResponse(
+        task_catalog.grouped_snapshot(collector_display_name, instance_display_name)
+    )
 
 
 @app.get("/trigger/{instance_id}", summary="手动触发采集器实例")
@@ -237,4 +223,13 @@ async def trigger_instance(instance_id: str):
 if __name__ == "__main__":  # pragma: no cover
     import uvicorn
 
-    uvicorn.run("rayinfo_backend.app:app", host="0.0.0.0", port=8000, reload=True)
+    # 显式指定 uvloop 和 httptools（随 uvicorn[standard] 安装），缺失时直接报错而不是
+    # 静默退回 asyncio/h11；uvloop 不支持 Windows。调度器运行在进程内，只能单 worker 启动
+    uvicorn.run(
+        "rayinfo_backend.app:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, AsyncIterator, Protocol
+from typing import Any
 from dataclasses import dataclass, field
 import time
 
@@ -14,12 +14,17 @@ class RawEvent:
     # 保存平台原始/半结构化数据，不做“过早清洗”
     raw: dict
 
-    # 抓取发生的时间（Unix 秒）
-    fetched_at: float = field(default_factory=time.time)
+    # 抓取发生的时间（Unix 纳秒），整数存储，避免浮点秒在微秒级丢失精度
+    fetched_at_ns: int = field(default_factory=time.time_ns)
 
     # 调试标记，如果为 True，该事件不会被持久化到数据库
     debug: bool = False
 
+    @property
+    def fetched_at(self) -> float:
+        """抓取发生的时间（Unix 秒），兼容旧的浮点字段"""
+        return self.fetched_at_ns / 1_000_000_000
+
 
 class CollectorError(Exception):
     """采集器基础异常类"""
@@ -63,19 +68,26 @@ class CollectorRetryableException(CollectorError):
 class CollectorRegistry:
     """注册中心: 管理所有 Collector 实例 (单例风格)."""
 
+    __slots__ = ("_collectors", "_all_cache")
+
     def __init__(self):
         self._collectors: dict[str, Any] = {}
+        # all() 的结果缓存，注册新采集器时失效
+        self._all_cache: tuple[Any, ...] | None = None
 
     def register(self, collector: Any):
         if collector.name in self._collectors:
             raise ValueError(f"collector already registered: {collector.name}")
         self._collectors[collector.name] = collector
+        self._all_cache = None
 
     def get(self, name: str) -> Any:
         return self._collectors[name]
 
-    def all(self) -> list[Any]:
-        return list(self._collectors.values())
+    def all(self) -> tuple[Any, ...]:
+        if self._all_cache is None:
+            self._all_cache = tuple(self._collectors.values())
+        return self._all_cache
 
 
 registry = CollectorRegistry()
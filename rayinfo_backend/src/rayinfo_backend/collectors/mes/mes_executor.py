@@ -1,29 +1,66 @@
 """MES 命令执行器
 
-调度器串行运行任务，因此这里不再需要额外的锁控制，
-尽量保持实现简单直接。
+每次搜索都在独立的子进程中执行。执行器单例上有两份跨任务共享的可变状态：
+按搜索引擎记录的配额冷却期（_quota_blocked_until）和短时结果缓存（_results_cache）。
+二者只在事件循环线程中读写，且每次读改写之间没有 await，
+调度器并发执行多个任务时协程不会交错修改，因此无需额外的锁控制。
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import re
+import subprocess
+import sys
 import time
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import orjson
 
 from ...ray_scheduler.consumer import BaseTaskConsumer
 from ...ray_scheduler.task import Task
+from ...utils.ttl_cache import TTLCache
 from ..base import CollectorRetryableException
 
 logger = logging.getLogger("rayinfo.collector.mes.executor")
 
+# Windows 的 Proactor 事件循环管理子进程管道开销较大，改在线程池中阻塞执行
+_USE_THREAD_SUBPROCESS = sys.platform == "win32"
+
+# Google Search API 的每日配额在太平洋时间零点重置；
+# 缺少时区数据（如 Windows 未安装 tzdata）时按 UTC 零点估算
+try:
+    _GOOGLE_QUOTA_RESET_TZ: Any = ZoneInfo("America/Los_Angeles")
+except ZoneInfoNotFoundError:  # pragma: no cover - 取决于运行环境
+    _GOOGLE_QUOTA_RESET_TZ = timezone.utc
+
+# mes 失败时 stderr 中表示短时限流的特征，按字节匹配，无需先解码。
+# 只匹配 HTTP 429 和 Google 的 (user)rateLimitExceeded 等限流错误；
+# 配额耗尽、计费未开通等不会自行恢复的错误不在此列，避免反复重试
+_RATE_LIMITED_STDERR = re.compile(
+    rb"(?i)\b(?:user)?ratelimitexceeded\b|rate limit exceeded|\b429\b|too many requests"
+)
+
+# stderr 提示被限流后，该搜索引擎暂停调用的秒数
+_STDERR_RATE_LIMIT_BACKOFF_SECONDS = 60
+
+# 相同 (query, engine, time_range) 的搜索结果在此时长内直接复用
+_RESULTS_CACHE_TTL_SECONDS = 60
+
 
 class MesExecutor(BaseTaskConsumer):
     """MES 命令执行器，负责通过 CLI 执行搜索任务"""
 
     def __init__(self, name: str = "mes.search"):
         super().__init__(name)
+        # 搜索引擎（小写）到配额恢复时刻（time.monotonic）的映射
+        self._quota_blocked_until: Dict[str, float] = {}
+        # 短时结果缓存，避免重复配置的定时搜索造成重复的子进程与 API 调用；
+        # 手动触发通过 use_cache=False 绕过
+        self._results_cache = TTLCache(maxsize=256, ttl=_RESULTS_CACHE_TTL_SECONDS)
         logger.info(
             "MesExecutor 初始化完成: name=%s",
             name,
@@ -38,6 +75,7 @@ class MesExecutor(BaseTaskConsumer):
             "query": str,          # 搜索查询关键词
             "engine": str,         # 搜索引擎名称 (google, duckduckgo, bing 等)
             "time_range": str,     # 时间范围过滤器 (可选)
+            "use_cache": bool,     # 是否复用短时结果缓存 (可选，手动触发时为 False)
         }
 
         Args:
@@ -58,6 +96,7 @@ class MesExecutor(BaseTaskConsumer):
         query = args.get("query")
         engine = args.get("engine")
         time_range = args.get("time_range")
+        use_cache = args.get("use_cache", True)
 
         # 验证必需参数
         if not query:
@@ -75,7 +114,9 @@ class MesExecutor(BaseTaskConsumer):
 
         try:
             # 执行搜索
-            results = await self.execute_mes_command(query, engine, time_range)
+            results = await self.execute_mes_command(
+                query, engine, time_range, use_cache=use_cache
+            )
             logger.info(
                 "MES 任务完成: uuid=%s, 结果数量=%d",
                 task.uuid,
@@ -94,7 +135,11 @@ class MesExecutor(BaseTaskConsumer):
             raise
 
     async def execute_mes_command(
-        self, query: str, engine: str, time_range: Optional[str] = None
+        self,
+        query: str,
+        engine: str,
+        time_range: Optional[str] = None,
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
         """执行 mes 命令并解析结果
 
@@ -102,6 +147,8 @@ class MesExecutor(BaseTaskConsumer):
             query: 搜索查询关键词
             engine: 搜索引擎名称 (google, duckduckgo, bing 等)
             time_range: 时间范围过滤器 (可选)
+            use_cache: 是否复用短时结果缓存。手动触发应传 False 以获取最新结果，
+                本次结果仍会写回缓存
 
         Returns:
             List[Dict[str, Any]]: 搜索结果列表
@@ -109,6 +156,20 @@ class MesExecutor(BaseTaskConsumer):
         Raises:
             CollectorRetryableException: 当 API 配额超限时抛出
         """
+        # 已知配额耗尽时直接失败，避免启动注定被拒绝的子进程
+        self._check_quota(engine)
+
+        cache_key = (query, engine.lower(), time_range)
+        cached = self._results_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            logger.info(
+                "复用缓存的 mes 结果: query=%s, engine=%s, 结果数量=%d",
+                query,
+                engine,
+                len(cached),
+            )
+            return cached
+
         logger.info(
             "开始执行 mes 命令: query=%s, engine=%s, time_range=%s",
             query,
@@ -118,6 +179,9 @@ class MesExecutor(BaseTaskConsumer):
 
         try:
             result = await self._run_mes_internal(query, engine, time_range)
+            # 命令失败时返回空列表，不缓存以便下次重新执行
+            if result:
+                self._results_cache.set(cache_key, result)
             logger.info(
                 "mes 命令执行完成: query=%s, engine=%s, 结果数量=%d",
                 query,
@@ -172,22 +236,27 @@ class MesExecutor(BaseTaskConsumer):
         if time_range:
             cmd.extend(["--time", time_range])
 
-        logger.debug("执行命令: %s", " ".join(cmd))
-
-        # 创建子进程执行 mes 命令
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        # join 是立即求值的参数，未开启 DEBUG 时跳过拼接
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("执行命令: %s", " ".join(cmd))
 
-        stdout, stderr = await proc.communicate()
+        returncode, stdout, stderr = await self._spawn(cmd)
 
         # 检查命令执行是否成功
-        if proc.returncode != 0:
+        if returncode != 0:
+            if _RATE_LIMITED_STDERR.search(stderr):
+                self._quota_blocked_until[engine.lower()] = (
+                    time.monotonic() + _STDERR_RATE_LIMIT_BACKOFF_SECONDS
+                )
+                raise CollectorRetryableException(
+                    retry_reason="stderr_rate_limit",
+                    retry_after=_STDERR_RATE_LIMIT_BACKOFF_SECONDS,
+                    message=f"mes 被限流: {stderr[:200].decode(errors='ignore')}",
+                )
+
             logger.warning(
                 "mes 命令执行失败: rc=%s, engine=%s, query=%s, stderr=%s",
-                proc.returncode,
+                returncode,
                 engine,
                 query,
                 stderr.decode(errors="ignore"),
@@ -196,12 +265,62 @@ class MesExecutor(BaseTaskConsumer):
 
         # 解析 JSON 输出
         try:
-            data = json.loads(stdout.decode())
+            # 直接解析字节输出，省去 decode 生成的中间字符串
+            data = orjson.loads(stdout)
             return self._parse_mes_output(data, engine)
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error("mes JSON 解析失败: query=%s, error=%s", query, e)
             return []
 
+    def _check_quota(self, engine: str) -> None:
+        """检查搜索引擎的配额是否处于耗尽窗口内
+
+        Args:
+            engine: 搜索引擎名称
+
+        Raises:
+            CollectorRetryableException: 配额尚未恢复时抛出
+        """
+        key = engine.lower()
+        blocked_until = self._quota_blocked_until.get(key)
+        if blocked_until is None:
+            return
+
+        retry_after = blocked_until - time.monotonic()
+        if retry_after <= 0:
+            del self._quota_blocked_until[key]
+            return
+
+        raise CollectorRetryableException(
+            retry_reason=f"{key}_api_quota",
+            retry_after=retry_after,
+            message=f"{engine} API 配额已耗尽，{retry_after:.0f} 秒后恢复",
+        )
+
+    @staticmethod
+    async def _spawn(cmd: List[str]) -> tuple[Optional[int], bytes, bytes]:
+        """执行命令并收集完整输出
+
+        Args:
+            cmd: 命令及参数
+
+        Returns:
+            (退出码, 标准输出, 标准错误)
+        """
+        if _USE_THREAD_SUBPROCESS:
+            completed = await asyncio.to_thread(
+                subprocess.run, cmd, capture_output=True
+            )
+            return completed.returncode, completed.stdout, completed.stderr
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        return proc.returncode, stdout, stderr
+
     def _parse_mes_output(
         self, data: Union[Dict[str, Any], List[Dict[str, Any]]], engine: str
     ) -> List[Dict[str, Any]]:
@@ -257,7 +376,8 @@ class MesExecutor(BaseTaskConsumer):
         limit_exceeded = rate_limit.get("limit_exceeded", False)
         requests_used = rate_limit.get("requests_used", 0)
         daily_limit = rate_limit.get("daily_limit", 0)
-        requests_remaining = rate_limit.get("requests_remaining", 0)
+        # 缺少该字段时未知剩余次数，不能当作已耗尽
+        requests_remaining = rate_limit.get("requests_remaining")
 
         logger.info(
             "搜索 API 速率限制信息 - 已使用: %s/%s, 剩余: %s, 超限: %s",
@@ -267,11 +387,22 @@ class MesExecutor(BaseTaskConsumer):
             limit_exceeded,
         )
 
-        # 检查是否达到 Google API 限额
-        if limit_exceeded and engine.lower() == "google":
-            # 计算下一次重置时间（24小时后）
-            reset_time = time.time() + 24 * 3600  # 24小时后
+        if engine.lower() != "google":
+            return
 
+        # 剩余次数已用完时，即便本次成功，后续请求也会被拒绝
+        exhausted = (
+            daily_limit > 0
+            and requests_remaining is not None
+            and requests_remaining <= 0
+        )
+        retry_after = None
+        if limit_exceeded or exhausted:
+            retry_after = self._quota_retry_after(rate_limit)
+            self._quota_blocked_until["google"] = time.monotonic() + retry_after
+
+        # 检查是否达到 Google API 限额
+        if limit_exceeded:
             logger.warning(
                 "Google API 每日配额已超限 - 已使用: %s/%s, 引擎: %s",
                 requests_used,
@@ -280,16 +411,42 @@ class MesExecutor(BaseTaskConsumer):
             )
 
             # 抛出配额超限异常，调度器会处理重调度逻辑
-            reset_delay = reset_time - time.time() if reset_time else None
             raise CollectorRetryableException(
                 retry_reason="google_api_quota",
-                retry_after=reset_delay,
+                retry_after=retry_after,
                 message=f"Google Search API 每日配额已超限 (已使用 {requests_used}/{daily_limit})",
             )
 
+    @staticmethod
+    def _quota_retry_after(rate_limit: Dict[str, Any]) -> float:
+        """计算配额恢复前需要等待的秒数
+
+        优先使用 mes 给出的 retry_after（秒）或 reset_at（Unix 时间戳，秒），
+        都没有时等到下一个太平洋时间零点，即 Google 每日配额的重置时刻。
+
+        Args:
+            rate_limit: 速率限制信息字典
+
+        Returns:
+            float: 等待秒数，至少为 1 秒
+        """
+        retry_after = rate_limit.get("retry_after")
+        if isinstance(retry_after, (int, float)):
+            return max(1.0, float(retry_after))
+
+        reset_at = rate_limit.get("reset_at")
+        if isinstance(reset_at, (int, float)):
+            return max(1.0, reset_at - time.time())
+
+        now = datetime.now(_GOOGLE_QUOTA_RESET_TZ)
+        next_reset = datetime.combine(
+            now.date() + timedelta(days=1), datetime.min.time(), now.tzinfo
+        )
+        return max(1.0, (next_reset - now).total_seconds())
+
 
-# 创建全局单例实例
-_mes_executor = MesExecutor()
+# 全局单例实例，首次使用时创建
+_mes_executor: Optional[MesExecutor] = None
 
 
 def get_mes_executor() -> MesExecutor:
@@ -298,11 +455,17 @@ def get_mes_executor() -> MesExecutor:
     Returns:
         MesExecutor: 全局单例实例
     """
+    global _mes_executor
+    if _mes_executor is None:
+        _mes_executor = MesExecutor()
     return _mes_executor
 
 
 async def execute_mes_command(
-    query: str, engine: str, time_range: Optional[str] = None
+    query: str,
+    engine: str,
+    time_range: Optional[str] = None,
+    use_cache: bool = True,
 ) -> List[Dict[str, Any]]:
     """便利函数：执行 mes 命令
 
@@ -312,6 +475,7 @@ async def execute_mes_command(
         query: 搜索查询关键词
         engine: 搜索引擎名称
         time_range: 时间范围过滤器 (可选)
+        use_cache: 是否复用短时结果缓存，手动触发时传 False
 
     Returns:
         List[Dict[str, Any]]: 搜索结果列表
@@ -319,4 +483,6 @@ async def execute_mes_command(
     Raises:
         CollectorRetryableException: 当 API 配额超限时抛出
     """
-    return await _mes_executor.execute_mes_command(query, engine, time_range)
+    return await get_mes_executor().execute_mes_command(
+        query, engine, time_range, use_cache=use_cache
+    )
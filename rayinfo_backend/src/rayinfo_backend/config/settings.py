@@ -41,8 +41,18 @@ class StorageConfig(BaseModel):
 class Settings(BaseModel):
     scheduler_timezone: str = Field(default="UTC")
     weibo_home_interval_seconds: int = Field(default=60)
+    # 每个 tick 最多并发执行的到期任务数，默认 1 即串行执行
+    scheduler_max_concurrency: int = Field(default=1, ge=1)
     search_engine: List[SearchEngineItem] = Field(default_factory=list)
     storage: StorageConfig = Field(default_factory=StorageConfig)
+    # 分页游标的 HMAC 签名密钥；未配置时每个进程随机生成，重启后旧游标失效
+    cursor_secret: Optional[str] = Field(default=None)
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        # 支持环境变量覆盖游标签名密钥
+        if "RAYINFO_CURSOR_SECRET" in os.environ:
+            self.cursor_secret = os.environ["RAYINFO_CURSOR_SECRET"]
 
     @staticmethod
     def from_yaml(path: Optional[Path | str] = None) -> "Settings":
@@ -77,8 +87,10 @@ class Settings(BaseModel):
             return Settings(
                 scheduler_timezone=data.get("scheduler_timezone", "UTC"),
                 weibo_home_interval_seconds=data.get("weibo_home_interval_seconds", 60),
+                scheduler_max_concurrency=data.get("scheduler_max_concurrency", 1),
                 search_engine=search_engine_items,
                 storage=storage_config,
+                cursor_secret=data.get("cursor_secret"),
             )
 
         except Exception as e:
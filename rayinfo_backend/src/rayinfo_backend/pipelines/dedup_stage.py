@@ -6,10 +6,11 @@
 from __future__ import annotations
 
 import hashlib
-import json
 from collections import OrderedDict
 from typing import Any, Dict
 
+import orjson
+
 from ..collectors.base import RawEvent
 from .stage_base import PipelineStage
 
@@ -65,14 +66,18 @@ class DedupStage(PipelineStage):
         # 如果启用内容哈希，对整个内容生成哈希
         if self.use_content_hash:
             try:
-                content_str = json.dumps(event.raw, sort_keys=True, ensure_ascii=False)
-                hash_obj = hashlib.md5(content_str.encode("utf-8"))
+                # 去重键只存在于进程内缓存，可直接对 orjson 输出的字节求哈希
+                content = orjson.dumps(
+                    event.raw, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                )
+                hash_obj = hashlib.md5(content)
                 return f"hash:{hash_obj.hexdigest()}"
             except (TypeError, ValueError) as e:
                 self.logger.warning(f"生成内容哈希失败: {e}")
 
-        # 最后回退到字符串表示
-        return f"str:{str(event.raw)}"
+        # 最后回退到字符串表示的摘要，避免缓存中保存整条数据的字符串
+        digest = hashlib.blake2b(str(event.raw).encode("utf-8"), digest_size=16)
+        return f"str:{digest.hexdigest()}"
 
     def _update_lru_cache(self, key: str) -> bool:
         """更新LRU缓存
@@ -117,7 +122,8 @@ class DedupStage(PipelineStage):
                 if self._update_lru_cache(dedup_key):
                     duplicates_count += 1
                     self._dedup_stats["duplicates_found"] += 1
-                    self.logger.debug(f"发现重复事件: {dedup_key}")
+                    # 惰性格式化：未开启 DEBUG 时不为每个重复事件拼接字符串
+                    self.logger.debug("发现重复事件: %s", dedup_key)
                 else:
                     unique_events.append(event)
 
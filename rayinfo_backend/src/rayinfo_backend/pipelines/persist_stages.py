@@ -9,6 +9,7 @@ from typing import Any, Dict
 
 from ..collectors.base import RawEvent
 from ..models.info_item import DatabaseManager
+from ..utils.change_hooks import notify_articles_changed
 from .stage_base import PipelineStage
 from .utils import DataTransformer, EventValidator
 
@@ -112,6 +113,8 @@ class SqlitePersistStage(PipelineStage):
 
             # 提交事务
             session.commit()
+            # 由 API 层注册的回调清除依赖资讯数据的响应缓存
+            notify_articles_changed()
 
             self.logger.info(f"成功保存 {len(events)} 条记录到数据库")
 
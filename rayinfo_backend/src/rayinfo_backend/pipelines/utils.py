@@ -7,10 +7,9 @@ from __future__ import annotations
 
 import hashlib
 import json
-from datetime import datetime
 
 from ..collectors.base import RawEvent
-from ..models.info_item import RawInfoItem
+from ..models.info_item import RawInfoItem, utcnow
 
 
 class DataTransformer:
@@ -42,7 +41,7 @@ class DataTransformer:
             query=raw_data.get("query"),
             engine=raw_data.get("engine"),
             raw_data=raw_data,
-            collected_at=datetime.utcnow(),
+            collected_at=utcnow(),
             processed=0,
         )
 
@@ -15,9 +15,12 @@ class BaseTaskConsumer(ABC):
     采用 OOP 继承设计方式，开发者需要基于该类派生出各种任务源。
     每种任务源表示一种特定的任务。
 
+    调度器默认串行执行任务；配置 max_concurrency 大于 1 时，
+    同一消费者的 consume 可能被不同任务并发调用，但同一任务不会同时执行两次。
+    子类不应在 consume 之间共享未加保护的可变状态。
+
     Attributes:
         name: 唯一标识符
-        concurrent_count: 限制任务并发数，默认为1
     """
 
     def __init__(self, name: str):
@@ -25,7 +28,6 @@ class BaseTaskConsumer(ABC):
 
         Args:
             name: 唯一标识符
-            concurrent_count: 并发数限制，默认为1
         """
         self.name = name
 
@@ -9,7 +9,9 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select, tuple_
 
 from ..models.info_item import DatabaseManager, CollectorExecutionState
 
@@ -26,6 +28,9 @@ class TaskExecutionManager:
     _instance = None
     _lock = threading.Lock()
 
+    # 执行记录写入后递增，供外部判断基于执行状态的缓存是否过期
+    state_version = 0
+
     def __new__(cls, db_path: str = "rayinfo.db"):
         """单例模式实现
 
@@ -147,6 +152,8 @@ class TaskExecutionManager:
                 )
 
             session.commit()
+            with self._lock:
+                TaskExecutionManager.state_version += 1
 
         except Exception as e:
             session.rollback()
@@ -214,6 +221,45 @@ class TaskExecutionManager:
         finally:
             session.close()
 
+    def get_last_execution_times(
+        self, keys: Iterable[Tuple[str, Optional[str]]]
+    ) -> Dict[Tuple[str, str], float]:
+        """一次查询获取多个任务的最后执行时间
+
+        Args:
+            keys: (任务源名称, 参数键) 列表，参数键为None时按空字符串处理
+
+        Returns:
+            {(任务源名称, 参数键): 最后执行时间戳}，首次运行的任务不在结果中
+        """
+        wanted = {(source, param_key or "") for source, param_key in keys}
+        if not wanted:
+            return {}
+
+        self._stats["queries_performed"] += 1
+
+        session = self.db_manager.get_session()
+        try:
+            rows = session.execute(
+                select(
+                    CollectorExecutionState.collector_name,
+                    CollectorExecutionState.param_key,
+                    CollectorExecutionState.last_execution_time,
+                ).where(
+                    tuple_(
+                        CollectorExecutionState.collector_name,
+                        CollectorExecutionState.param_key,
+                    ).in_(sorted(wanted))
+                )
+            )
+            return {(source, param_key): last for source, param_key, last in rows}
+
+        except Exception as e:
+            logger.error("批量查询任务执行时间失败 count=%d error=%s", len(wanted), e)
+            return {}
+        finally:
+            session.close()
+
     def calculate_next_schedule_time(
         self,
         task_source: str,
@@ -233,8 +279,28 @@ class TaskExecutionManager:
         Returns:
             下次调度的绝对时间戳
         """
-        current_time = time.time()
         last_time = self.get_last_execution_time(task_source, param_key)
+        return self.schedule_after(task_source, interval_seconds, param_key, last_time)
+
+    def schedule_after(
+        self,
+        task_source: str,
+        interval_seconds: int,
+        param_key: Optional[str],
+        last_time: Optional[float],
+    ) -> float:
+        """根据已知的最后执行时间计算下次调度时间
+
+        Args:
+            task_source: 任务源名称
+            interval_seconds: 调度间隔（秒）
+            param_key: 参数键
+            last_time: 最后执行时间戳，首次运行为None
+
+        Returns:
+            下次调度的绝对时间戳
+        """
+        current_time = time.time()
 
         if last_time is None:
             # 首次运行，立即执行
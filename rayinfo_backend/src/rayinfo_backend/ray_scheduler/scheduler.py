@@ -3,7 +3,7 @@
 该实现采用数据驱动思路：
 - 应用启动时将定时任务与历史执行记录加载到内存字典中
 - 由一个固定 1 秒 tick 的定时循环检查任务字典
-- 每个 tick 最多执行一个到期任务，其余任务顺延至下一次 tick
+- 每个 tick 最多并发执行 max_concurrency 个到期任务（默认 1），其余任务顺延至下一次 tick
 
 相比上一版基于最小堆和信号量的实现，这里刻意降低了抽象层级，
 以换取更好的可读性和便于未来对外暴露任务表。
@@ -12,15 +12,20 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import contextlib
+import heapq
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .task import Task
 from .registry import registry
 from .execution_manager import TaskExecutionManager
 
+# 解析后待加载的任务定义：(原始定义, source, interval_seconds, args, param_key)
+_PendingTask = Tuple[Dict[str, Any], str, Optional[int], Dict[str, Any], Optional[str]]
+
 
 class RayScheduler:
     """数据驱动的简化调度器"""
@@ -30,6 +35,7 @@ class RayScheduler:
         enable_execution_tracking: bool = True,
         db_path: str = "rayinfo.db",
         tick_interval: float = 1.0,
+        max_concurrency: int = 1,
     ):
         """初始化调度器
 
@@ -37,9 +43,15 @@ class RayScheduler:
             enable_execution_tracking: 是否启用执行时间记录
             db_path: 数据库文件路径
             tick_interval: 定时循环的周期，单位秒
+            max_concurrency: 每个 tick 最多并发执行的到期任务数
         """
         self._tick_interval = max(0.1, tick_interval)
+        self._max_concurrency = max(1, max_concurrency)
         self._tasks: Dict[str, Dict[str, Any]] = {}
+        # 任务表增删时递增，供外部判断基于任务表的缓存是否过期
+        self._tasks_version = 0
+        # 按时间排序的下次执行时间，供状态查询二分统计；任务表或执行时间变化时置空
+        self._sorted_run_times: Optional[List[datetime]] = None
         self._running = False
         self._loop_task: Optional[asyncio.Task] = None
 
@@ -61,6 +73,8 @@ class RayScheduler:
         """
         tasks: Dict[str, Dict[str, Any]] = {}
         now = datetime.now(timezone.utc)
+        # 先解析全部定义，再一次查询出所有任务的历史执行时间
+        pending: List[_PendingTask] = []
 
         for raw in definitions:
             try:
@@ -74,7 +88,11 @@ class RayScheduler:
             param_key = raw.get("param_key")
             if param_key is None and args:
                 param_key = TaskExecutionManager.build_param_key(args)
+            pending.append((raw, source, interval_seconds, args, param_key))
+
+        last_times = self._load_last_execution_times(pending)
 
+        for raw, source, interval_seconds, args, param_key in pending:
             task_id = raw.get("task_id") or self._build_task_id(source, param_key)
 
             next_run_at = raw.get("start_at")
@@ -87,6 +105,7 @@ class RayScheduler:
                     interval_seconds,
                     param_key,
                     now,
+                    last_times,
                 )
 
             tasks[task_id] = {
@@ -106,6 +125,8 @@ class RayScheduler:
             )
 
         self._tasks = tasks
+        self._tasks_version += 1
+        self._sorted_run_times = None
 
     async def start(self) -> None:
         """启动调度器主循环（幂等）"""
@@ -137,7 +158,7 @@ class RayScheduler:
         self._log.info("Scheduler timer loop started")
         try:
             while self._running:
-                await self._execute_due_task()
+                await self._execute_due_tasks()
                 await asyncio.sleep(self._tick_interval)
         except asyncio.CancelledError:
             self._log.debug("Scheduler timer loop cancelled")
@@ -147,13 +168,20 @@ class RayScheduler:
         finally:
             self._log.info("Scheduler timer loop stopped")
 
-    async def _execute_due_task(self) -> None:
-        picked = self._pick_due_entry()
+    async def _execute_due_tasks(self) -> None:
+        """并发执行本 tick 选出的到期任务，全部完成后才进入下一次 tick"""
+        picked = self._pick_due_entries(self._max_concurrency)
         if not picked:
             return
+        if len(picked) == 1:
+            await self._execute_entry(*picked[0])
+            return
 
-        task_id, entry = picked
+        await asyncio.gather(
+            *(self._execute_entry(task_id, entry) for task_id, entry in picked)
+        )
 
+    async def _execute_entry(self, task_id: str, entry: Dict[str, Any]) -> None:
         task = Task(
             source=entry["source"],
             args=dict(entry["args"]),
@@ -191,7 +219,8 @@ class RayScheduler:
             )
             self._reschedule_entry(task_id, entry, success=False)
 
-    def _pick_due_entry(self) -> Optional[Tuple[str, Dict[str, Any]]]:
+    def _pick_due_entries(self, limit: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """按到期时间先后选出最多 limit 个到期任务"""
         now = datetime.now(timezone.utc)
         due = [
             (task_id, entry)
@@ -199,10 +228,10 @@ class RayScheduler:
             if entry["next_run_at"] <= now
         ]
 
-        if not due:
-            return None
+        if len(due) <= 1:
+            return due
 
-        return min(due, key=lambda item: item[1]["next_run_at"])
+        return heapq.nsmallest(limit, due, key=lambda item: item[1]["next_run_at"])
 
     def _reschedule_entry(
         self, task_id: str, entry: Dict[str, Any], *, success: bool
@@ -210,11 +239,14 @@ class RayScheduler:
         interval_seconds = entry.get("interval_seconds")
         if interval_seconds is None or interval_seconds <= 0:
             self._tasks.pop(task_id, None)
+            self._tasks_version += 1
+            self._sorted_run_times = None
             self._log.info("移除一次性任务: id=%s", task_id)
             return
 
         base_time = datetime.now(timezone.utc)
         entry["next_run_at"] = base_time + timedelta(seconds=interval_seconds)
+        self._sorted_run_times = None
         status = "success" if success else "fail"
         self._log.debug(
             "重排任务: id=%s status=%s next_run=%s",
@@ -223,6 +255,11 @@ class RayScheduler:
             entry["next_run_at"],
         )
 
+    @property
+    def tasks_version(self) -> int:
+        """任务表版本号，任务增删时递增"""
+        return self._tasks_version
+
     def get_queue_size(self) -> int:
         """获取当前任务表中的任务数量"""
         return len(self._tasks)
@@ -232,10 +269,44 @@ class RayScheduler:
 
     def get_next_task_time(self) -> Optional[datetime]:
         """获取下一个要执行的任务时间"""
-        if not self._tasks:
-            return None
+        run_times = self._get_sorted_run_times()
+        return run_times[0] if run_times else None
+
+    def get_pending_count(self, now: datetime) -> int:
+        """统计在给定时间点已到期的任务数
+
+        Args:
+            now: 判断是否到期的当前时间（带时区）
+
+        Returns:
+            int: 已到期任务数
+        """
+        return bisect.bisect_right(self._get_sorted_run_times(), now)
 
-        return min(entry["next_run_at"] for entry in self._tasks.values())
+    def get_schedule_summary(self, now: datetime) -> Tuple[int, Optional[datetime]]:
+        """统计已到期任务数和最早的下次执行时间
+
+        Args:
+            now: 判断是否到期的当前时间（带时区）
+
+        Returns:
+            (已到期任务数, 最早的下次执行时间)，任务表为空时时间为None
+        """
+        run_times = self._get_sorted_run_times()
+        earliest = run_times[0] if run_times else None
+        return bisect.bisect_right(run_times, now), earliest
+
+    def _get_sorted_run_times(self) -> List[datetime]:
+        """获取排序后的下次执行时间列表
+
+        执行时间只在加载、重排任务时变化，而状态接口会被高频轮询，
+        因此排序结果缓存到下一次变化为止，查询只需二分。
+        """
+        if self._sorted_run_times is None:
+            self._sorted_run_times = sorted(
+                entry["next_run_at"] for entry in self._tasks.values()
+            )
+        return self._sorted_run_times
 
     def get_tasks_snapshot(self) -> Dict[str, Dict[str, Any]]:
         """返回任务表快照，方便未来对外暴露"""
@@ -250,12 +321,27 @@ class RayScheduler:
             for task_id, entry in self._tasks.items()
         }
 
+    def _load_last_execution_times(
+        self, pending: List[_PendingTask]
+    ) -> Dict[Tuple[str, str], float]:
+        """批量读取需要智能调度的任务的历史执行时间，未启用执行记录时返回空字典"""
+        if not self._enable_execution_tracking or not self._execution_manager:
+            return {}
+        return self._execution_manager.get_last_execution_times(
+            (source, param_key)
+            for raw, source, interval_seconds, _, param_key in pending
+            if raw.get("start_at") is None
+            and interval_seconds is not None
+            and interval_seconds > 0
+        )
+
     def _calculate_initial_schedule(
         self,
         source: str,
         interval_seconds: Optional[int],
         param_key: Optional[str],
         fallback_time: datetime,
+        last_times: Dict[Tuple[str, str], float],
     ) -> datetime:
         if (
             not self._enable_execution_tracking
@@ -265,8 +351,11 @@ class RayScheduler:
         ):
             return fallback_time
 
-        timestamp = self._execution_manager.calculate_next_schedule_time(
-            source, interval_seconds, param_key
+        timestamp = self._execution_manager.schedule_after(
+            source,
+            interval_seconds,
+            param_key,
+            last_times.get((source, param_key or "")),
         )
         return datetime.fromtimestamp(timestamp, timezone.utc)
 
@@ -0,0 +1,43 @@
+"""数据变更通知
+
+资讯写入发生在采集管道中，而依赖这些数据的响应缓存位于 API 层。
+为避免管道层反向依赖 API 层，由 API 层在导入时注册回调，
+管道提交新资讯后只需调用 notify_articles_changed。
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, List
+
+logger = logging.getLogger("rayinfo.change_hooks")
+
+ArticlesChangedHook = Callable[[], None]
+
+_ARTICLES_CHANGED_HOOKS: List[ArticlesChangedHook] = []
+
+
+def on_articles_changed(hook: ArticlesChangedHook) -> ArticlesChangedHook:
+    """注册资讯数据变更后的回调，重复注册同一回调只生效一次
+
+    Args:
+        hook: 无参回调，如清除响应缓存的函数
+
+    Returns:
+        ArticlesChangedHook: 原回调，便于作为装饰器使用
+    """
+    if hook not in _ARTICLES_CHANGED_HOOKS:
+        _ARTICLES_CHANGED_HOOKS.append(hook)
+    return hook
+
+
+def notify_articles_changed() -> None:
+    """依次调用已注册的回调
+
+    在数据提交之后调用，单个回调失败只记录日志，不影响其余回调和调用方。
+    """
+    for hook in tuple(_ARTICLES_CHANGED_HOOKS):
+        try:
+            hook()
+        except Exception:  # noqa: BLE001
+            logger.exception("资讯变更回调执行失败: %r", hook)
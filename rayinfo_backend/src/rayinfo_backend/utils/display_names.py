@@ -0,0 +1,45 @@
+"""采集器显示名称
+
+API 层（采集器列表、来源统计）共用的来源标识到中文显示名称的映射。
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Final, Mapping, Optional
+
+# 采集器标识到显示名称的只读映射，未收录的采集器直接显示标识
+DISPLAY_NAMES: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "mes.search": "搜索引擎",
+        "weibo.home": "微博首页",
+        "rss.feed": "RSS订阅",
+    }
+)
+
+
+def collector_display_name(collector_name: str) -> str:
+    """获取采集器的显示名称
+
+    Args:
+        collector_name: 采集器标识，如 ``mes.search``
+
+    Returns:
+        str: 显示名称，未收录时返回标识本身
+    """
+    return DISPLAY_NAMES.get(collector_name, collector_name)
+
+
+def instance_display_name(collector_name: str, param: Optional[str]) -> str:
+    """获取采集器实例的显示名称
+
+    Args:
+        collector_name: 采集器标识
+        param: 实例参数（如搜索关键词），无参数的采集器为 None
+
+    Returns:
+        str: 有参数时返回参数本身，否则返回采集器的显示名称
+    """
+    if param is None:
+        return collector_display_name(collector_name)
+    return param
@@ -11,7 +11,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 import logging
-from typing import Any, Callable, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 from ..config.settings import Settings, get_settings
 from ..models.info_item import CollectorExecutionState, DatabaseManager
@@ -100,6 +101,15 @@ class TaskCatalog:
         self._scheduler_provider = scheduler_provider
         self._settings_provider = settings_provider
         self._db_manager: DatabaseManager | None = None
+        # (cache key, {instance_id: (collector_name, param)})
+        self._flat_index: Tuple[Any, Mapping[str, Tuple[str, Optional[str]]]] = (
+            None,
+            MappingProxyType({}),
+        )
+        # (cache key, {"total_count": ..., "instances": {instance_id: dict}})
+        self._instances_payload: Tuple[Any, Dict[str, Any]] = (None, {})
+        # (display name functions) -> (cache key, grouped response)
+        self._grouped: Dict[Tuple[Callable, Callable], Tuple[Any, Dict[str, Any]]] = {}
 
     def list_instances(self) -> Dict[str, InstanceSnapshot]:
         """Return all configured collector instances."""
@@ -120,6 +130,109 @@ class TaskCatalog:
         instances = self.list_instances()
         return instances.get(instance_id)
 
+    def flat_index(self) -> Mapping[str, Tuple[str, Optional[str]]]:
+        """Return ``{instance_id: (collector_name, param)}`` for request filters.
+
+        Unlike :meth:`list_instances` this skips the execution-state query and
+        is only rebuilt when the scheduler task table or the settings change.
+        The index is a read-only view shared by all callers; a rebuild swaps
+        in a new mapping instead of mutating the old one.
+        """
+
+        scheduler = self._scheduler_provider()
+        settings = self._settings_provider()
+        version = getattr(scheduler, "tasks_version", None)
+        cacheable = scheduler is None or version is not None
+        key = (scheduler, version, settings)
+
+        cached_key, index = self._flat_index
+        if cacheable and cached_key == key:
+            return index
+
+        index = MappingProxyType(
+            {
+                instance_id: (record.collector_name, record.param)
+                for instance_id, record in self._build_base_instances().items()
+            }
+        )
+        if cacheable:
+            self._flat_index = (key, index)
+        return index
+
+    def instances_snapshot(self) -> Dict[str, Any]:
+        """Return every instance as a plain dictionary, ready to serve.
+
+        ``to_dict()`` runs once per instance when the scheduler task table, the
+        settings or any recorded execution state changes; until then the same
+        payload is returned and callers must not mutate it.
+        """
+
+        cacheable, key = self._snapshot_key()
+        cached_key, payload = self._instances_payload
+        if cacheable and cached_key == key:
+            return payload
+
+        instances = self.list_instances()
+        payload = {
+            "total_count": len(instances),
+            "instances": {
+                instance_id: record.to_dict()
+                for instance_id, record in instances.items()
+            },
+        }
+        if cacheable:
+            self._instances_payload = (key, payload)
+        return payload
+
+    def grouped_snapshot(
+        self,
+        collector_display_name: Callable[[str], str],
+        instance_display_name: Callable[[str, Optional[str]], str],
+    ) -> Dict[str, Any]:
+        """Return instances grouped by collector, ready to serve as a response.
+
+        The result is memoised until the scheduler task table, the settings or
+        any recorded execution state changes; callers must not mutate it.
+
+        Args:
+            collector_display_name: Maps a collector name to its display name.
+            instance_display_name: Maps ``(collector_name, param)`` to the
+                instance display name.
+        """
+
+        cacheable, key = self._snapshot_key()
+        builders = (collector_display_name, instance_display_name)
+        cached = self._grouped.get(builders)
+        if cacheable and cached is not None and cached[0] == key:
+            return cached[1]
+
+        collectors_by_type: Dict[str, Dict[str, Any]] = {}
+        for instance in self.instances_snapshot()["instances"].values():
+            collector_name = instance["collector_name"]
+            group = collectors_by_type.get(collector_name)
+            if group is None:
+                group = collectors_by_type[collector_name] = {
+                    "collector_name": collector_name,
+                    "display_name": collector_display_name(collector_name),
+                    "total_instances": 0,
+                    "instances": [],
+                }
+
+            payload = dict(instance)
+            payload["display_name"] = instance_display_name(
+                collector_name, instance["param"]
+            )
+            group["instances"].append(payload)
+            group["total_instances"] += 1
+
+        grouped = {
+            "total_collectors": len(collectors_by_type),
+            "collectors": collectors_by_type,
+        }
+        if cacheable:
+            self._grouped[builders] = (key, grouped)
+        return grouped
+
     def get_collector_instances(
         self, collector_name: str
     ) -> Dict[str, InstanceSnapshot]:
@@ -134,6 +247,16 @@ class TaskCatalog:
 
     # Internal helpers -------------------------------------------------
 
+    def _snapshot_key(self) -> Tuple[bool, Any]:
+        """Return ``(cacheable, key)`` identifying the current instance state."""
+
+        scheduler = self._scheduler_provider()
+        settings = self._settings_provider()
+        version = getattr(scheduler, "tasks_version", None)
+        cacheable = scheduler is None or version is not None
+        key = (scheduler, version, settings, TaskExecutionManager.state_version)
+        return cacheable, key
+
     def _build_base_instances(self) -> Dict[str, InstanceSnapshot]:
         instances: Dict[str, InstanceSnapshot] = {}
 
@@ -0,0 +1,117 @@
+"""进程内 TTL 缓存
+
+为读多写少的接口结果提供简单的过期缓存，避免在每次请求时重复执行聚合查询。
+缓存以 ``time.monotonic`` 计时，读写均加锁，可在线程池中安全使用。
+每次失效都会递增代数，计算期间发生过失效的结果不会再写回缓存。
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """带过期时间和容量上限的键值缓存
+
+    超过 ``maxsize`` 时淘汰最早写入的条目；过期条目在读取时惰性清除。
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 30.0):
+        """初始化缓存
+
+        Args:
+            maxsize: 最大条目数
+            ttl: 条目存活秒数
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 失效代数，invalidate 时递增
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """当前失效代数，计算缓存值之前读取，写入时传给 set 校验"""
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """读取未过期的缓存值
+
+        Args:
+            key: 缓存键
+            default: 未命中时的返回值
+
+        Returns:
+            缓存值，未命中或已过期时返回 default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, generation: Optional[int] = None
+    ) -> None:
+        """写入缓存值
+
+        Args:
+            key: 缓存键
+            value: 缓存值
+            generation: 计算该值之前读取的失效代数；期间缓存已失效时放弃写入，
+                为 None 时无条件写入
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """读取缓存值，未命中时调用 factory 计算并写入
+
+        factory 在锁外执行，并发未命中时可能被调用多次，结果以最后一次写入为准。
+        factory 执行期间缓存被失效时，结果可能基于失效前的数据，只返回不写入。
+
+        Args:
+            key: 缓存键
+            factory: 生成缓存值的无参函数
+
+        Returns:
+            缓存值
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            generation = self._generation
+            value = factory()
+            self.set(key, value, generation=generation)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """使缓存失效
+
+        Args:
+            key: 要清除的键，为 None 时清空全部缓存
+        """
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, text
+
+from rayinfo_backend.api.repositories import ArticleRepository
+from rayinfo_backend.api.schemas import ArticleFilters
+from rayinfo_backend.models.info_item import (
+    ArticleReadStatus,
+    DatabaseManager,
+    RawInfoItem,
+)
+
+
+def _build_repository(tmp_path, count: int = 30) -> ArticleRepository:
+    DatabaseManager.reset_instance()
+    db_manager = DatabaseManager.get_instance(str(tmp_path / "rayinfo.db"))
+
+    session = db_manager.get_session()
+    try:
+        base = datetime(2024, 1, 1)
+        for i in range(count):
+            session.add(
+                RawInfoItem(
+                    post_id=f"post-{i:03d}",
+                    source="mes.search",
+                    title=f"title {i}",
+                    query="example query",
+                    raw_data={"index": i},
+                    # 每两条共享一个采集时间，覆盖 post_id 作为次排序键的情况
+                    collected_at=base + timedelta(minutes=i // 2),
+                )
+            )
+        session.add(ArticleReadStatus(post_id="post-001", is_read=True))
+        session.commit()
+    finally:
+        session.close()
+
+    return ArticleRepository(db_manager)
+
+
+@contextmanager
+def _count_statements(repository: ArticleRepository):
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = repository.db_manager.engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_articles_with_read_status_use_single_query(tmp_path):
+    repository = _build_repository(tmp_path)
+
+    with _count_statements(repository) as statements:
+        rows, total, next_cursor = repository.get_articles_with_read_status(
+            ArticleFilters(limit=10)
+        )
+        for article, read_status in rows:
+            _ = (article.title, read_status.is_read if read_status else False)
+
+    assert len(rows) == 10
+    assert total is None
+    assert next_cursor is not None
+    assert len(statements) <= 2
+
+
+def test_search_articles_joins_read_status(tmp_path):
+    repository = _build_repository(tmp_path)
+
+    with _count_statements(repository) as statements:
+        rows, _, _ = repository.search_articles("title 1", ArticleFilters(limit=50))
+
+    read_map = {article.post_id: status for article, status in rows}
+    assert read_map["post-001"] is not None and read_map["post-001"].is_read
+    assert len(statements) <= 2
+
+
+def test_cursor_pagination_walks_all_rows(tmp_path):
+    repository = _build_repository(tmp_path, count=25)
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        rows, _, cursor = repository.get_articles_with_read_status(
+            ArticleFilters(limit=7, cursor=cursor)
+        )
+        seen.extend(article.post_id for article, _ in rows)
+        if cursor is None:
+            break
+
+    assert len(seen) == 25
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_read_status_filters_split_articles(tmp_path):
+    repository = _build_repository(tmp_path, count=10)
+
+    read_rows, _, _ = repository.get_articles_with_read_status(
+        ArticleFilters(limit=50, read_status="read")
+    )
+    unread_rows, _, _ = repository.get_articles_with_read_status(
+        ArticleFilters(limit=50, read_status="unread")
+    )
+
+    assert [article.post_id for article, _ in read_rows] == ["post-001"]
+    assert len(unread_rows) == 9
+    assert all(status is None for _, status in unread_rows)
+
+
+def test_update_read_status_checks_existence_in_the_upsert(tmp_path):
+    repository = _build_repository(tmp_path, count=3)
+
+    with _count_statements(repository) as statements:
+        status = repository.update_read_status("post-002", True)
+        missing = repository.update_read_status("missing", True)
+
+    assert len(statements) == 2
+    assert status.is_read and status.read_at is not None
+    assert missing is None
+    assert repository.get_read_status("missing") is None
+
+    status = repository.update_read_status("post-002", False)
+    assert status.is_read is False and status.read_at is None
+
+
+def test_total_count_comes_back_with_the_page(tmp_path):
+    repository = _build_repository(tmp_path, count=25)
+
+    with _count_statements(repository) as statements:
+        rows, total, _ = repository.get_articles_with_read_status(
+            ArticleFilters(limit=10, page=2, include_total=True)
+        )
+
+    assert total == 25
+    assert len(statements) == 1
+    assert all(len(row) == 2 for row in rows)
+
+    # 页码超出范围时没有行携带窗口计数，退回单独统计
+    rows, total, _ = repository.get_articles_with_read_status(
+        ArticleFilters(limit=10, page=9, include_total=True)
+    )
+    assert rows == [] and total == 25
+
+    _, total, _ = repository.search_articles(
+        "title 1", ArticleFilters(limit=5, include_total=True)
+    )
+    assert total == 11
+
+
+def test_list_queries_are_served_by_indexes(tmp_path):
+    repository = _build_repository(tmp_path, count=5)
+    engine = repository.db_manager.engine
+
+    executed: list[tuple] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        for filters in (
+            ArticleFilters(limit=10),
+            ArticleFilters(limit=10, source="mes.search"),
+            ArticleFilters(limit=10, query="example query"),
+            ArticleFilters(limit=10, source="mes.search", query="example query"),
+            ArticleFilters(
+                limit=10, source="mes.search", start_date=datetime(2024, 1, 1)
+            ),
+        ):
+            repository.get_articles_with_read_status(filters)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    with engine.connect() as conn:
+        for statement, parameters in executed:
+            plan = [
+                row[3]
+                for row in conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+            ]
+            # 筛选和排序都应由复合索引完成，不出现全表扫描或额外排序
+            assert any("USING INDEX idx_raw_info_items_" in step for step in plan), plan
+            assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+def test_search_uses_sqlite_fts_index(tmp_path):
+    repository = _build_repository(tmp_path, count=12)
+    assert repository.db_manager.search_fts_enabled
+
+    session = repository.db_manager.get_session()
+    try:
+        session.get(RawInfoItem, "post-004").title = "人工智能 周报"
+        session.commit()
+    finally:
+        session.close()
+
+    with _count_statements(repository) as statements:
+        rows, _, _ = repository.search_articles("智能周", ArticleFilters(limit=50))
+        assert rows == []
+        rows, _, _ = repository.search_articles("智能 周", ArticleFilters(limit=50))
+
+    assert [article.post_id for article, _ in rows] == ["post-004"]
+    assert all("raw_info_items_fts MATCH" in statement for statement in statements)
+
+    # 不足 3 个字符时退回 LIKE 子串匹配
+    rows, _, _ = repository.search_articles("11", ArticleFilters(limit=50))
+    assert [article.post_id for article, _ in rows] == ["post-011"]
+
+
+def test_search_index_is_rebuilt_after_rowids_are_renumbered(tmp_path):
+    repository = _build_repository(tmp_path, count=12)
+    db_path = str(tmp_path / "rayinfo.db")
+
+    # 模拟 VACUUM 对隐式 rowid 重新编号：搜索索引仍指向旧 rowid
+    with repository.db_manager.engine.begin() as conn:
+        conn.execute(text("UPDATE raw_info_items SET rowid = rowid + 1000"))
+    rows, _, _ = repository.search_articles("title 7", ArticleFilters(limit=50))
+    assert rows == []
+
+    # 重新启动后索引按当前 rowid 重建
+    DatabaseManager.reset_instance()
+    repository = ArticleRepository(DatabaseManager.get_instance(db_path))
+    rows, _, _ = repository.search_articles("title 7", ArticleFilters(limit=50))
+    assert [article.post_id for article, _ in rows] == ["post-007"]
+
+
+def test_update_read_statuses_skips_missing_articles_in_one_statement(tmp_path):
+    repository = _build_repository(tmp_path, count=5)
+
+    with _count_statements(repository) as statements:
+        rows = repository.update_read_statuses(
+            ["post-004", "missing", "post-001"], True
+        )
+
+    assert len(statements) == 1
+    assert [row.post_id for row in rows] == ["post-004", "post-001"]
+    assert repository.get_read_status("missing") is None
+
+
+def test_sources_stats_read_the_trigger_maintained_summary(tmp_path):
+    repository = _build_repository(tmp_path, count=6)
+
+    session = repository.db_manager.get_session()
+    try:
+        session.get(RawInfoItem, "post-000").source = "rss.feed"
+        session.commit()
+    finally:
+        session.close()
+
+    with _count_statements(repository) as statements:
+        stats = repository.get_sources_stats()
+
+    assert [(stat.name, stat.count) for stat in stats] == [
+        ("mes.search", 5),
+        ("rss.feed", 1),
+    ]
+    assert stats[0].latest_update == datetime(2024, 1, 1, 0, 2)
+    assert "raw_info_items" not in statements[0]
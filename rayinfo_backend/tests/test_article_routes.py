@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from rayinfo_backend.api.services import ArticleService, get_article_service
+from rayinfo_backend.api.v1 import routes
+from rayinfo_backend.utils.change_hooks import notify_articles_changed
+
+from .test_article_repository import _build_repository
+
+
+def _build_client(tmp_path, monkeypatch) -> TestClient:
+    repository = _build_repository(tmp_path, count=30)
+    notify_articles_changed()
+    monkeypatch.setattr(
+        routes.task_catalog,
+        "flat_index",
+        lambda: {"mes.search:abc": ("mes.search", "example query")},
+    )
+
+    app = FastAPI()
+    app.include_router(routes.router)
+    app.dependency_overrides[get_article_service] = lambda: ArticleService(repository)
+    return TestClient(app)
+
+
+def test_stream_matches_articles_for_the_same_filters(tmp_path, monkeypatch):
+    client = _build_client(tmp_path, monkeypatch)
+
+    for params in (
+        {"limit": 7},
+        {"limit": 5, "instance_id": "mes.search:abc", "read_status": "unread"},
+    ):
+        page = client.get("/api/v1/articles", params=params)
+        stream = client.get("/api/v1/articles/stream", params=params)
+        assert page.status_code == stream.status_code == 200
+        assert orjson.loads(stream.content) == page.json()
+
+        cursor = page.json()["pagination"]["next_cursor"]
+        params = {**params, "cursor": cursor}
+        page = client.get("/api/v1/articles", params=params)
+        stream = client.get("/api/v1/articles/stream", params=params)
+        assert orjson.loads(stream.content) == page.json()
+
+
+def test_stream_rejects_unknown_instance_like_articles(tmp_path, monkeypatch):
+    client = _build_client(tmp_path, monkeypatch)
+
+    for path in ("/api/v1/articles", "/api/v1/articles/stream"):
+        response = client.get(path, params={"instance_id": "missing"})
+        assert response.status_code == 404
+        assert response.json() == {"detail": "采集器实例 missing 不存在"}
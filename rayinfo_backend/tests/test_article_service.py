@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from rayinfo_backend.api import services
+from rayinfo_backend.api.schemas import ArticleFilters, ReadStatusRequest
+from rayinfo_backend.api.services import ArticleService, ReadStatusService
+from rayinfo_backend.utils.change_hooks import notify_articles_changed
+
+from .test_article_repository import _build_repository, _count_statements
+
+
+def test_page_numbers_use_offset_pagination(tmp_path):
+    repository = _build_repository(tmp_path, count=25)
+    service = ArticleService(repository)
+
+    seen: list[str] = []
+    for page in (1, 2, 3):
+        with _count_statements(repository) as statements:
+            response = service.get_articles_paginated(
+                ArticleFilters(page=page, limit=10)
+            )
+        seen.extend(article.post_id for article in response.data)
+        assert response.pagination.current_page == page
+        if page > 1:
+            # 页码请求不依赖其他请求留下的状态：内层只翻页主键，外层回表读取当前页
+            assert "AS page_ids" in statements[0]
+
+    assert seen == [f"post-{i:03d}" for i in range(24, -1, -1)]
+
+
+def test_concurrent_toggles_are_combined_into_shared_writes(tmp_path):
+    repository = _build_repository(tmp_path, count=20)
+    service = ReadStatusService(repository)
+    post_ids = [f"post-{i:03d}" for i in range(20)] + ["missing"]
+
+    with _count_statements(repository) as statements:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(
+                    lambda post_id: service.toggle_read_status(
+                        post_id, ReadStatusRequest(is_read=True)
+                    ),
+                    post_ids,
+                )
+            )
+
+    assert [result.post_id for result in results[:-1]] == post_ids[:-1]
+    assert all(result.is_read for result in results[:-1])
+    assert results[-1] is None
+    assert len(statements) <= len(post_ids)
+    assert repository.get_read_status("post-019").is_read
+
+
+def test_search_results_are_cached_until_read_status_changes(tmp_path):
+    services._ARTICLE_PAGES_CACHE.invalidate()
+    repository = _build_repository(tmp_path, count=5)
+    service = ArticleService(repository)
+    filters = ArticleFilters(limit=10)
+
+    first = service.search_articles_json("title 3", filters)
+    with _count_statements(repository) as statements:
+        assert service.search_articles_json("title 3", filters) == first
+    assert statements == []
+
+    ReadStatusService(repository).toggle_read_status(
+        "post-003", ReadStatusRequest(is_read=True)
+    )
+    assert b'"is_read":true' in service.search_articles_json("title 3", filters)
+
+
+def test_search_read_racing_a_toggle_is_not_cached(tmp_path, monkeypatch):
+    services._ARTICLE_PAGES_CACHE.invalidate()
+    repository = _build_repository(tmp_path, count=5)
+    service = ArticleService(repository)
+    filters = ArticleFilters(limit=10)
+    search = repository.search_articles
+
+    def _search_then_toggle(search_query, query_filters):
+        result = search(search_query, query_filters)
+        # 查询完成、写回缓存之前，另一个请求修改了已读状态
+        ReadStatusService(repository).toggle_read_status(
+            "post-003", ReadStatusRequest(is_read=True)
+        )
+        return result
+
+    monkeypatch.setattr(repository, "search_articles", _search_then_toggle)
+    assert b'"is_read":false' in service.search_articles_json("title 3", filters)
+    monkeypatch.undo()
+
+    assert b'"is_read":true' in service.search_articles_json("title 3", filters)
+
+
+def test_article_change_notification_clears_api_caches():
+    services._ARTICLE_PAGES_CACHE.set("page", b"{}")
+    services._SOURCES_STATS_CACHE.set(services._SOURCES_STATS_KEY, [])
+
+    # 管道层只发出通知，不直接依赖 API 层
+    notify_articles_changed()
+
+    assert len(services._ARTICLE_PAGES_CACHE) == 0
+    assert len(services._SOURCES_STATS_CACHE) == 0
+
+
+def test_sources_stats_racing_an_ingest_are_not_cached(tmp_path, monkeypatch):
+    services._SOURCES_STATS_CACHE.invalidate()
+    service = ArticleService(_build_repository(tmp_path, count=3))
+    load = service._load_sources_stats
+
+    def _load_then_ingest():
+        result = load()
+        # 统计完成、写回缓存之前，管道提交了新资讯
+        notify_articles_changed()
+        return result
+
+    monkeypatch.setattr(service, "_load_sources_stats", _load_then_ingest)
+    service.get_sources_stats_json()
+
+    assert len(services._SOURCES_STATS_CACHE) == 0
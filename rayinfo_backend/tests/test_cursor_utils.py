@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+
+import pytest
+
+from rayinfo_backend.api.cursor_utils import decode_cursor, encode_cursor
+
+SECRET = b"test-secret"
+
+
+def test_cursor_round_trip():
+    collected_at = datetime(2024, 1, 1, 12, 30, 15, 123456)
+
+    cursor = encode_cursor(collected_at, "post:001", SECRET)
+
+    assert decode_cursor(cursor, SECRET) == (collected_at, "post:001")
+
+
+def test_cursor_rejects_tampering_and_foreign_secret():
+    cursor = encode_cursor(datetime(2024, 1, 1), "post-001", SECRET)
+    raw = bytearray(base64.urlsafe_b64decode(cursor))
+    raw[-1] ^= 0x01
+    tampered = base64.urlsafe_b64encode(bytes(raw)).decode("ascii")
+
+    with pytest.raises(ValueError):
+        decode_cursor(tampered, SECRET)
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, b"other-secret")
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor", SECRET)
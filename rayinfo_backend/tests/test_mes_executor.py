@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import orjson
+import pytest
+
+from rayinfo_backend.collectors.base import CollectorRetryableException
+from rayinfo_backend.collectors.mes.mes_executor import MesExecutor
+from rayinfo_backend.ray_scheduler.task import Task
+
+
+async def test_exhausted_google_quota_skips_further_mes_calls(monkeypatch):
+    executor = MesExecutor()
+    calls: list[list[str]] = []
+    payload = {
+        "results": [{"title": "t"}],
+        "rate_limit": {
+            "limit_exceeded": False,
+            "requests_used": 100,
+            "daily_limit": 100,
+            "requests_remaining": 0,
+        },
+    }
+
+    async def _fake_spawn(cmd):
+        calls.append(cmd)
+        return 0, orjson.dumps(payload), b""
+
+    monkeypatch.setattr(executor, "_spawn", _fake_spawn)
+
+    # 用完最后一次配额的请求仍正常返回结果
+    assert await executor.execute_mes_command("q", "google") == [{"title": "t"}]
+
+    with pytest.raises(CollectorRetryableException) as exc_info:
+        await executor.execute_mes_command("q", "Google")
+    assert exc_info.value.retry_reason == "google_api_quota"
+    assert len(calls) == 1
+
+    # 其他搜索引擎不受影响
+    await executor.execute_mes_command("q", "duckduckgo")
+    assert len(calls) == 2
+
+
+async def test_google_payload_without_remaining_does_not_block(monkeypatch):
+    executor = MesExecutor()
+    calls: list[list[str]] = []
+    payload = {
+        "results": [{"title": "t"}],
+        "rate_limit": {"limit_exceeded": False, "requests_used": 3, "daily_limit": 100},
+    }
+
+    async def _fake_spawn(cmd):
+        calls.append(cmd)
+        return 0, orjson.dumps(payload), b""
+
+    monkeypatch.setattr(executor, "_spawn", _fake_spawn)
+
+    await executor.execute_mes_command("q", "google")
+    await executor.execute_mes_command("other", "google")
+    assert len(calls) == 2
+    assert executor._quota_blocked_until == {}
+
+
+async def test_google_quota_block_follows_reported_retry_after(monkeypatch):
+    executor = MesExecutor()
+    payload = {
+        "results": [],
+        "rate_limit": {
+            "limit_exceeded": True,
+            "requests_used": 100,
+            "daily_limit": 100,
+            "retry_after": 120,
+        },
+    }
+
+    async def _fake_spawn(cmd):
+        return 0, orjson.dumps(payload), b""
+
+    monkeypatch.setattr(executor, "_spawn", _fake_spawn)
+
+    with pytest.raises(CollectorRetryableException) as exc_info:
+        await executor.execute_mes_command("q", "google")
+    assert exc_info.value.retry_after == 120
+
+
+def test_google_quota_without_reset_info_waits_until_next_pacific_midnight():
+    retry_after = MesExecutor._quota_retry_after({"limit_exceeded": True})
+    assert 0 < retry_after <= 25 * 3600
+
+
+async def test_repeated_search_reuses_cached_results(monkeypatch):
+    executor = MesExecutor()
+    calls: list[list[str]] = []
+
+    async def _fake_spawn(cmd):
+        calls.append(cmd)
+        return 0, orjson.dumps({"results": [{"title": "t"}]}), b""
+
+    monkeypatch.setattr(executor, "_spawn", _fake_spawn)
+
+    first = await executor.execute_mes_command("q", "duckduckgo", "d")
+    second = await executor.execute_mes_command("q", "duckduckgo", "d")
+    assert first == second == [{"title": "t"}]
+    assert len(calls) == 1
+
+    # 时间范围不同视为不同的搜索
+    await executor.execute_mes_command("q", "duckduckgo", "w")
+    assert len(calls) == 2
+
+
+async def test_manual_trigger_bypasses_cached_results(monkeypatch):
+    executor = MesExecutor()
+    calls: list[list[str]] = []
+
+    async def _fake_spawn(cmd):
+        calls.append(cmd)
+        return 0, orjson.dumps({"results": [{"title": f"t{len(calls)}"}]}), b""
+
+    monkeypatch.setattr(executor, "_spawn", _fake_spawn)
+
+    await executor.execute_mes_command("q", "duckduckgo")
+    manual_task = Task(
+        source=executor.name,
+        args={"query": "q", "engine": "duckduckgo", "use_cache": False},
+    )
+    await executor.consume(manual_task)
+    assert len(calls) == 2
+
+    # 手动触发拿到的新结果会刷新缓存，之后的定时搜索直接复用
+    assert await executor.execute_mes_command("q", "duckduckgo") == [{"title": "t2"}]
+    assert len(calls) == 2
+
+
+async def test_rate_limited_stderr_raises_retryable_and_backs_off(monkeypatch):
+    executor = MesExecutor()
+    calls: list[list[str]] = []
+
+    async def _fake_spawn(cmd):
+        calls.append(cmd)
+        return 1, b"", b"Error: HTTP 429 Too Many Requests"
+
+    monkeypatch.setattr(executor, "_spawn", _fake_spawn)
+
+    with pytest.raises(CollectorRetryableException) as exc_info:
+        await executor.execute_mes_command("q", "bing")
+    assert exc_info.value.retry_reason == "stderr_rate_limit"
+
+    # 退避期间不再启动子进程
+    with pytest.raises(CollectorRetryableException):
+        await executor.execute_mes_command("other", "bing")
+    assert len(calls) == 1
+
+
+async def test_non_rate_limit_quota_errors_are_not_retried(monkeypatch):
+    executor = MesExecutor()
+    calls: list[list[str]] = []
+
+    async def _fake_spawn(cmd):
+        calls.append(cmd)
+        return 1, b"", b"Error 403: quota exceeded for project; billing disabled"
+
+    monkeypatch.setattr(executor, "_spawn", _fake_spawn)
+
+    # 计费等硬性错误按普通失败处理，不进入限流退避
+    assert await executor.execute_mes_command("q", "google") == []
+    assert await executor.execute_mes_command("q", "google") == []
+    assert len(calls) == 2
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+
+from rayinfo_backend.models.info_item import CollectorExecutionState, DatabaseManager
+from rayinfo_backend.ray_scheduler import (
+    BaseTaskConsumer,
+    RayScheduler,
+    TaskExecutionManager,
+    registry,
+)
+
+
+def test_load_tasks_reads_execution_history_in_one_query(tmp_path, monkeypatch):
+    DatabaseManager.reset_instance()
+    monkeypatch.setattr(TaskExecutionManager, "_instance", None)
+    db_path = str(tmp_path / "rayinfo.db")
+    db_manager = DatabaseManager.get_instance(db_path)
+
+    definitions = [
+        {"source": "mes.search", "interval_seconds": 600, "args": {"query": q}}
+        for q in ("alpha", "beta", "gamma")
+    ]
+    recent_key = TaskExecutionManager.build_param_key({"query": "alpha"})
+    last_run = time.time() - 60
+
+    session = db_manager.get_session()
+    try:
+        session.add(
+            CollectorExecutionState(
+                collector_name="mes.search",
+                param_key=recent_key,
+                last_execution_time=last_run,
+                created_at=last_run,
+                updated_at=last_run,
+                execution_count=1,
+            )
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    scheduler = RayScheduler(db_path=db_path)
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_manager.engine, "before_cursor_execute", _record)
+    try:
+        scheduler.load_tasks(definitions)
+    finally:
+        event.remove(db_manager.engine, "before_cursor_execute", _record)
+
+    assert len(statements) == 1
+    snapshot = scheduler.get_tasks_snapshot()
+    assert len(snapshot) == 3
+    # 最近执行过的任务按间隔顺延，其余任务立即调度
+    recent = snapshot[f"mes.search:{recent_key}"]["next_run_at"]
+    assert abs(recent.timestamp() - (last_run + 600)) < 1
+    others = [
+        entry["next_run_at"]
+        for task_id, entry in snapshot.items()
+        if task_id != f"mes.search:{recent_key}"
+    ]
+    assert all(next_run.timestamp() <= time.time() for next_run in others)
+
+    due, earliest = scheduler.get_schedule_summary(datetime.now(timezone.utc))
+    assert due == 2
+    assert earliest == min(others)
+
+    # 重排后排序缓存失效，到期统计随之更新
+    [(task_id, entry)] = scheduler._pick_due_entries(1)
+    scheduler._reschedule_entry(task_id, entry, success=True)
+    assert scheduler.get_pending_count(datetime.now(timezone.utc)) == 1
+
+
+class _ConcurrencyProbe(BaseTaskConsumer):
+    def __init__(self):
+        super().__init__("test.probe")
+        self.running = 0
+        self.peak = 0
+
+    async def consume(self, task):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+
+
+async def test_due_tasks_run_concurrently_up_to_limit():
+    probe = _ConcurrencyProbe()
+    registry.register(probe)
+    try:
+        scheduler = RayScheduler(enable_execution_tracking=False, max_concurrency=2)
+        scheduler.load_tasks(
+            {"source": "test.probe", "interval_seconds": 600, "args": {"n": n}}
+            for n in range(3)
+        )
+
+        await scheduler._execute_due_tasks()
+
+        assert probe.peak == 2
+        assert scheduler.get_pending_count(datetime.now(timezone.utc)) == 1
+    finally:
+        registry.unregister("test.probe")
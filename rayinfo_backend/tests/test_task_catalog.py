@@ -115,3 +115,65 @@ def test_task_catalog_merges_execution_state(tmp_path):
     assert record.status == "active"
     assert record.last_run is not None
     assert record.last_run.endswith("+00:00")
+
+
+def test_flat_index_rebuilds_when_tasks_change(tmp_path):
+    DatabaseManager.reset_instance()
+    settings = _build_settings(str(tmp_path / "rayinfo.db"))
+
+    class VersionedScheduler(FakeScheduler):
+        tasks_version = 1
+
+    scheduler = VersionedScheduler({})
+    catalog = TaskCatalog(
+        scheduler_provider=lambda: scheduler,
+        settings_provider=lambda: settings,
+    )
+
+    index = catalog.flat_index()
+    assert index["weibo.home"] == ("weibo.home", None)
+    assert catalog.flat_index() is index
+
+    scheduler._snapshot = {
+        "rss.feed:abc": {
+            "source": "rss.feed",
+            "args": {"url": "https://example.com/feed"},
+            "interval_seconds": 60,
+            "next_run_at": datetime.now(timezone.utc),
+            "param_key": "abc",
+        }
+    }
+    scheduler.tasks_version = 2
+
+    index = catalog.flat_index()
+    assert index["rss.feed:abc"] == ("rss.feed", "https://example.com/feed")
+
+
+def test_grouped_snapshot_is_cached_until_state_changes(tmp_path, monkeypatch):
+    DatabaseManager.reset_instance()
+    settings = _build_settings(str(tmp_path / "rayinfo.db"))
+    catalog = TaskCatalog(
+        scheduler_provider=lambda: None,
+        settings_provider=lambda: settings,
+    )
+
+    def display(name, param=None):
+        return param or name.upper()
+
+    instances = catalog.instances_snapshot()
+    assert instances["total_count"] == 2
+    assert catalog.instances_snapshot() is instances
+
+    grouped = catalog.grouped_snapshot(display, display)
+    assert grouped["total_collectors"] == 2
+    assert grouped["collectors"]["weibo.home"]["display_name"] == "WEIBO.HOME"
+    assert grouped["collectors"]["weibo.home"]["instances"][0]["instance_id"] == (
+        "weibo.home"
+    )
+    assert catalog.grouped_snapshot(display, display) is grouped
+
+    monkeypatch.setattr(
+        TaskExecutionManager, "state_version", TaskExecutionManager.state_version + 1
+    )
+    assert catalog.grouped_snapshot(display, display) is not grouped
+    assert catalog.instances_snapshot() is not instances
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from rayinfo_backend.utils.ttl_cache import TTLCache
+
+
+def test_value_computed_across_an_invalidation_is_not_cached():
+    cache = TTLCache(maxsize=4, ttl=60)
+
+    def _stale_factory():
+        # 模拟计算过程中有写入触发了失效
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get_or_set("key", _stale_factory) == "stale"
+    assert cache.get("key") is None
+
+    assert cache.get_or_set("key", lambda: "fresh") == "fresh"
+    assert cache.get("key") == "fresh"
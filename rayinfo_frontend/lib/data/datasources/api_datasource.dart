@@ -114,6 +114,7 @@ class ApiDataSourceImpl implements ApiDataSource {
       'q': searchQuery,
       'page': page,
       'limit': limit,
+      'include_total': true, // 搜索页需要展示结果总数
     };
 
     if (source != null) queryParameters['source'] = source;
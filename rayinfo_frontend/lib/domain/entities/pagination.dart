@@ -3,16 +3,16 @@ import 'package:equatable/equatable.dart';
 /// 分页信息模型
 class Pagination extends Equatable {
   final int currentPage;
-  final int totalPages;
-  final int totalItems;
+  final int? totalPages;
+  final int? totalItems;
   final int perPage;
   final bool hasNext;
   final bool hasPrev;
   
   const Pagination({
     required this.currentPage,
-    required this.totalPages,
-    required this.totalItems,
+    this.totalPages,
+    this.totalItems,
     required this.perPage,
     required this.hasNext,
     required this.hasPrev,
@@ -22,8 +22,8 @@ class Pagination extends Equatable {
   factory Pagination.fromJson(Map<String, dynamic> json) {
     return Pagination(
       currentPage: json['current_page'] as int,
-      totalPages: json['total_pages'] as int,
-      totalItems: json['total_items'] as int,
+      totalPages: json['total_pages'] as int?,
+      totalItems: json['total_items'] as int?,
       perPage: json['per_page'] as int,
       hasNext: json['has_next'] as bool,
       hasPrev: json['has_prev'] as bool,
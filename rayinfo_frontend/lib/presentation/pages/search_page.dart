@@ -178,7 +178,7 @@ class _SearchPageState extends State<SearchPage> {
           padding: const EdgeInsets.all(16),
           color: Theme.of(context).colorScheme.surface,
           child: Text(
-            '找到 ${state.pagination.totalItems} 条关于 \"${state.query}\" 的结果',
+            '找到 ${state.pagination.totalItems ?? 0} 条关于 \"${state.query}\" 的结果',
             style: Theme.of(context).textTheme.bodyMedium?.copyWith(
               color: Theme.of(context).textTheme.bodySmall?.color,
             ),
@@ -1,2 +1,2 @@
 cd ./rayinfo_backend
-poetry run uvicorn rayinfo_backend.app:app --reload
\ No newline at end of file
+poetry run uvicorn rayinfo_backend.app:app --reload --loop uvloop --http httptools
\ No newline at end of file